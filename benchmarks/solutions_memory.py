@@ -0,0 +1,81 @@
+"""Compare the memory Solutions takes with plain lists of paths.
+
+Solves a dense grid, made of letters that go together well so that there are
+lots of paths, then keeps the same paths twice over: in a Solutions, packed
+into arrays, and in a dict of lists of lists of ints, the way Solutions used
+to keep them. Prints the memory each holds on to and how long each took to
+fill.
+
+Run from the repository root:
+
+    python -m benchmarks.solutions_memory [-n SIDE] [-s SEED] [WORD_LIST]
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+from pysquaredle.dictionary import Dictionary
+from pysquaredle.profiling import MEGABYTE
+from pysquaredle.puzzle import Puzzle
+from pysquaredle.solutions import Solutions
+from pysquaredle.solver import PuzzleSearch
+
+# a few common letters, which make for many paths to each word
+DENSE_LETTERS = "AELST"
+
+
+def held(fill: Callable[[], Any]) -> tuple[int, float]:
+    """Bytes still allocated by what fill returns, and seconds it took."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    kept = fill()
+    seconds = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size, seconds
+
+
+def main() -> None:
+    """Solve a dense grid and print what its paths cost each way."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("word_list", nargs="?", default="word_list.txt")
+    parser.add_argument("-n", "--side", type=int, default=10)
+    parser.add_argument("-s", "--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    puzzle = Puzzle("".join(rng.choices(DENSE_LETTERS, k=args.side**2)))
+    found = list(PuzzleSearch(Dictionary.load(args.word_list), puzzle))
+    print(f"{puzzle.letters}: {len({word for word, _ in found})} words, ", end="")
+    print(f"{len(found)} paths")
+
+    def packed() -> Solutions:
+        solutions = Solutions()
+        for word, path in found:
+            solutions.add(word, path)
+        return solutions
+
+    def lists() -> dict[str, list[list[int]]]:
+        solutions: dict[str, list[list[int]]] = defaultdict(list)
+        for word, path in found:
+            # copied, as the search hands out lists it made for the purpose
+            solutions[word].append(list(path))
+        return solutions
+
+    print(f"{'storage':<16}{'MB':>10}{'bytes/path':>12}{'fill s':>10}")
+    for name, fill in [("lists", lists), ("packed arrays", packed)]:
+        size, seconds = held(fill)
+        print(
+            f"{name:<16}{size / MEGABYTE:>10.2f}{size / len(found):>12.1f}"
+            f"{seconds:>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Compare grid-first and word-first solving across grid sizes and word lists.
+
+Prints, for each word list and grid size, the mean candidate words per cell
+and the mean time each strategy takes to solve.
+Where word-first stops winning is what WORD_FIRST_WORDS_PER_CELL in
+pysquaredle/solver.py is based on.
+
+Run from the repository root:
+
+    python -m benchmarks.strategies [-n PUZZLES] [-s SEED] [WORD_LIST ...]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from pysquaredle.helpers import random_letters
+from pysquaredle.puzzle import Puzzle
+from pysquaredle.solver import Solver, Strategy
+
+WORD_LISTS = ["test_word_list.txt", "wordlists/common.txt", "word_list.txt"]
+SIDES = range(3, 9)
+
+
+def timed_solve(letters: str, word_list: str, strategy: Strategy) -> float:
+    """Seconds to solve, including building the trie if the strategy needs it.
+
+    Loading and pruning the word list is the same for both, so not counted:
+    the search, which does the pruning, is set up before the clock starts.
+    """
+    solver = Solver(Puzzle(letters), word_list, lazy=True, strategy=strategy)
+    # Solver sets its search up lazily, so make it do that now
+    solver.strategy  # noqa: B018
+    start = time.perf_counter()
+    solver.solve()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the comparison and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("word_lists", nargs="*", default=WORD_LISTS)
+    parser.add_argument("-n", "--puzzles", type=int, default=5)
+    parser.add_argument("-s", "--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'word list':<24}{'grid':>6}{'words/cell':>12}{'grid s':>10}{'word s':>10}")
+    for word_list in args.word_lists:
+        # warm the word list cache so neither strategy pays for it
+        Solver(Puzzle("ABCD"), word_list, lazy=True)
+        random.seed(args.seed)
+        for side in SIDES:
+            puzzles = [random_letters(side * side) for _ in range(args.puzzles)]
+            per_cell = statistics.mean(
+                Solver(Puzzle(p), word_list, lazy=True).word_list_count / len(p)
+                for p in puzzles
+            )
+            grid = statistics.mean(
+                timed_solve(p, word_list, Strategy.GRID) for p in puzzles
+            )
+            word = statistics.mean(
+                timed_solve(p, word_list, Strategy.WORD) for p in puzzles
+            )
+            print(
+                f"{word_list:<24}{side:>4}x{side:<1}{per_cell:>12.1f}"
+                f"{grid:>10.4f}{word:>10.4f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""Benchmark Solver across grid sizes, word lists and engines.
+
+Solves the same seeded grids, 3x3 to 8x8 with and without gaps, against each
+word list with each engine:
+
+    grid     grid-first search of a Trie
+    compact  grid-first search of a CompactTrie
+    word     word-first, tracing each candidate word
+    dawg     grid-first search of the word list compiled to a DAWG
+
+and prints the mean time to load the word list, build what the search needs
+(filter the words and make the trie), search, and the peak memory. Times and
+memory come from separate runs, since tracing memory slows everything down.
+
+--save keeps the results in benchmarks/results/ named after the current
+commit, and --compare shows how this run does against a saved one.
+
+Run from the repository root:
+
+    python -m benchmarks.suite [-n PUZZLES] [-s SEED] [--save] [--compare REF]
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from pysquaredle.dawg import compile_dawg
+from pysquaredle.dictionary import Dictionary
+from pysquaredle.profiling import MEGABYTE, Profile
+from pysquaredle.puzzle import LETTER_BAG, Puzzle
+from pysquaredle.solver import Solver, Strategy
+
+WORD_LISTS = ["test_word_list.txt", "wordlists/common.txt", "word_list.txt"]
+ENGINES = ["grid", "compact", "word", "dawg"]
+SIDES = range(3, 9)
+# share of cells left as gaps in the gap grids
+GAP_SHARE = 0.2
+RESULTS = Path(__file__).parent / "results"
+
+
+def grids(side: int, count: int, seed: int, *, gaps: bool) -> list[str]:
+    """The same count random grids every time for a given seed."""
+    rng = random.Random(f"{seed}-{side}-{gaps}")
+    puzzles = []
+    for _ in range(count):
+        letters = rng.choices(LETTER_BAG, k=side * side)
+        if gaps:
+            for cell in rng.sample(range(side * side), int(side * side * GAP_SHARE)):
+                letters[cell] = "_"
+        puzzles.append("".join(letters))
+    return puzzles
+
+
+def load(word_list: str, engine: str, dawg_dir: Path) -> tuple[Dictionary, Any]:
+    """Load the word list the way engine needs it, timing it and its memory.
+
+    For the DAWG engine that means compiling it first, which isn't counted.
+    """
+    source: str | Path = word_list
+    if engine == "dawg":
+        source = dawg_dir / f"{Path(word_list).stem}.dawg"
+        if not source.exists():
+            words = Path(word_list).read_text(encoding="utf-8").splitlines()
+            compile_dawg(words, source)
+
+    with Profile(trace_memory=False) as timed:
+        dictionary = Dictionary.load(source, compact=engine == "compact")
+    with Profile() as traced:
+        Dictionary.load(source, compact=engine == "compact")
+    return dictionary, {"load_s": timed.seconds, "load_peak": traced.peak_bytes}
+
+
+def measure(dictionary: Dictionary, engine: str, puzzles: list[str]) -> dict[str, Any]:
+    """Mean build and search times, and peak memory, of solving puzzles."""
+    strategy = Strategy.WORD if engine == "word" else Strategy.GRID
+
+    def run(*, trace_memory: bool) -> tuple[list[Profile], int]:
+        profiles = []
+        words = 0
+        for letters in puzzles:
+            with Profile(trace_memory=trace_memory) as profile:
+                solver = Solver(Puzzle(letters), dictionary, strategy=strategy)
+            profiles.append(profile)
+            words += solver.word_count()
+        return profiles, words
+
+    timed, words = run(trace_memory=False)
+    traced, _ = run(trace_memory=True)
+
+    def mean_seconds(*names: str) -> float:
+        return statistics.mean(
+            sum(p.phases[n].seconds for n in names if n in p.phases) for p in timed
+        )
+
+    return {
+        "build_s": mean_seconds("filter", "trie"),
+        "search_s": mean_seconds("search"),
+        "peak": max(p.peak_bytes or 0 for p in traced),
+        "words": words,
+    }
+
+
+def git_ref() -> str:
+    """The current commit, marked if there are uncommitted changes."""
+
+    def git(*args: str) -> str:
+        return subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=False
+        ).stdout.strip()
+
+    commit = git("rev-parse", "--short", "HEAD") or "unknown"
+    return (
+        f"{commit}-dirty"
+        if git("status", "--porcelain", "--untracked-files=no")
+        else commit
+    )
+
+
+def key(row: dict[str, Any]) -> tuple[str, str, int, bool]:
+    """What a result is for, to match it up with another run's."""
+    return row["word_list"], row["engine"], row["side"], row["gaps"]
+
+
+def header(baseline: dict[Any, Any]) -> str:
+    """Column titles for the table of results."""
+    return (
+        f"{'word list':<22}{'engine':<9}{'grid':>7}{'load s':>9}{'build s':>9}"
+        f"{'search s':>10}{'peak MB':>9}{'words':>7}"
+    ) + (f"{'vs base':>9}" if baseline else "")
+
+
+def format_row(row: dict[str, Any], baseline: dict[Any, Any]) -> str:
+    """One result, with search time relative to the baseline's if there is one.
+
+    Gap grids are marked with an underscore.
+    """
+    grid = f"{row['side']}x{row['side']}{'_' if row['gaps'] else ''}"
+    line = (
+        f"{row['word_list']:<22}{row['engine']:<9}{grid:>7}"
+        f"{row['load_s']:>9.3f}{row['build_s']:>9.4f}{row['search_s']:>10.4f}"
+        f"{row['peak'] / MEGABYTE:>9.2f}{row['words']:>7}"
+    )
+    if (base := baseline.get(key(row))) and base["search_s"]:
+        line += f"{row['search_s'] / base['search_s']:>8.2f}x"
+    return line
+
+
+def main() -> None:
+    """Run the suite and print, save or compare the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--word-lists", nargs="+", default=WORD_LISTS)
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=ENGINES)
+    parser.add_argument("-n", "--puzzles", type=int, default=3)
+    parser.add_argument("-s", "--seed", type=int, default=1)
+    parser.add_argument(
+        "--save", action="store_true", help="keep the results for this commit"
+    )
+    parser.add_argument(
+        "--compare", metavar="REF", help="a saved commit, or results file, to compare"
+    )
+    args = parser.parse_args()
+
+    baseline: dict[Any, Any] = {}
+    if args.compare:
+        saved = Path(args.compare)
+        if not saved.exists():
+            saved = RESULTS / f"{args.compare}.json"
+        record = json.loads(saved.read_text(encoding="utf-8"))
+        if (record["puzzles"], record["seed"]) != (args.puzzles, args.seed):
+            print(
+                f"{saved} used {record['puzzles']} puzzles with seed "
+                f"{record['seed']}, so the grids differ",
+                file=sys.stderr,
+            )
+        baseline = {key(row): row for row in record["rows"]}
+
+    print(header(baseline))
+    rows = []
+    started = time.perf_counter()
+    with tempfile.TemporaryDirectory() as dawg_dir:
+        for word_list in args.word_lists:
+            for engine in args.engines:
+                dictionary, loading = load(word_list, engine, Path(dawg_dir))
+                for gaps in (False, True):
+                    for side in SIDES:
+                        puzzles = grids(side, args.puzzles, args.seed, gaps=gaps)
+                        row = (
+                            {
+                                "word_list": word_list,
+                                "engine": engine,
+                                "side": side,
+                                "gaps": gaps,
+                            }
+                            | loading
+                            | measure(dictionary, engine, puzzles)
+                        )
+                        rows.append(row)
+                        print(format_row(row, baseline), flush=True)
+
+    ref = git_ref()
+    print(f"{len(rows)} results for {ref} in {time.perf_counter() - started:.1f}s")
+    if args.save:
+        RESULTS.mkdir(exist_ok=True)
+        saved = RESULTS / f"{ref}.json"
+        record = {
+            "commit": ref,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": sys.version.split()[0],
+            "machine": platform.machine(),
+            "puzzles": args.puzzles,
+            "seed": args.seed,
+            "rows": rows,
+        }
+        saved.write_text(json.dumps(record, indent=1), encoding="utf-8")
+        print(f"Saved to {saved}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""Solve lots of puzzles with a single dictionary load.
+
+Puzzles come one per line, either as bare letters or as JSON objects with a
+"letters" key and an optional "id". Each solved puzzle becomes one JSON
+object, so results can be streamed out as JSON lines while the rest are
+still being solved.
+
+Classes
+    BatchStats
+
+Functions
+    read_puzzles
+    parse_puzzle
+    solve_batch
+    solution_record
+"""
+
+import json
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from pysquaredle.dictionary import Dictionary
+from pysquaredle.puzzle import Puzzle
+from pysquaredle.solution_cache import SolutionCache
+from pysquaredle.solver import SearchOptions, Solver, Strategy
+
+NO_LETTERS = 'JSON puzzle lines need a "letters" string'
+
+
+@dataclass
+class BatchStats:
+    """Running totals for a batch."""
+
+    puzzles: int = 0
+    failures: int = 0
+    words: int = 0
+    seconds: float = 0.0
+    load_seconds: float = 0.0
+
+    @property
+    def per_second(self) -> float:
+        """Puzzles solved per second spent solving."""
+        return self.puzzles / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        """One line for humans."""
+        return (
+            f"{self.puzzles} puzzles solved, {self.failures} failed, "
+            f"{self.words} words found in {self.seconds:.3f}s "
+            f"({self.per_second:.1f} puzzles/s), word list loaded in "
+            f"{self.load_seconds:.3f}s"
+        )
+
+
+def read_puzzles(lines: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """Yield (line number, line) for each non-blank line, still to be parsed.
+
+    Parsing is left to solve_batch, so a bad line is one failed puzzle
+    rather than the end of the batch.
+    """
+    for number, raw in enumerate(lines, start=1):
+        if line := raw.strip():
+            yield str(number), line
+
+
+def parse_puzzle(puzzle_id: str, line: str) -> tuple[str, str]:
+    """The (id, letters) in a line of bare letters or JSON.
+
+    Bare letters keep puzzle_id. JSON lines use their "id" if they have one.
+    Raises ValueError for JSON that doesn't parse or has no letters.
+    """
+    if not line.startswith("{"):
+        return puzzle_id, line
+
+    # JSONDecodeError is a ValueError too
+    record = json.loads(line)
+    letters = record.get("letters")
+    if not isinstance(letters, str):
+        raise ValueError(NO_LETTERS)
+    return str(record.get("id", puzzle_id)), letters
+
+
+def solve_batch(
+    puzzles: Iterable[tuple[str, str]],
+    word_list_path: str,
+    stats: BatchStats,
+    *,
+    use_cache: bool = True,
+    compact: bool = False,
+    workers: int = 1,
+    count_only: bool = False,
+    strategy: Strategy = Strategy.AUTO,
+    options: SearchOptions | None = None,
+    cache: SolutionCache | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Solve each puzzle in turn, yielding a JSON-ready result for each.
+
+    puzzles are (id, line) pairs, see read_puzzles and parse_puzzle. The
+    Dictionary is loaded once up front rather than once per puzzle. A
+    puzzle that can't be read or solved (bad JSON or letters, say) gets an
+    "error" entry rather than stopping the batch. stats is updated as
+    results are yielded. With a cache, repeated puzzles are only solved
+    once. compact and workers are as for Solver.
+    """
+    start = time.perf_counter()
+    dictionary = Dictionary.load(word_list_path, use_cache=use_cache, compact=compact)
+    stats.load_seconds = time.perf_counter() - start
+
+    for number, line in puzzles:
+        start = time.perf_counter()
+        try:
+            puzzle_id, letters = parse_puzzle(number, line)
+        except ValueError as error:
+            stats.failures += 1
+            yield {"id": number, "error": str(error)}
+            continue
+
+        try:
+            solver = Solver(
+                Puzzle(letters),
+                dictionary,
+                workers=workers,
+                count_only=count_only,
+                strategy=strategy,
+                options=options,
+                cache=cache,
+            )
+        except ValueError as error:
+            seconds = time.perf_counter() - start
+            stats.failures += 1
+            stats.seconds += seconds
+            yield {"id": puzzle_id, "letters": letters, "error": str(error)}
+            continue
+
+        seconds = time.perf_counter() - start
+        stats.puzzles += 1
+        stats.words += solver.word_count()
+        stats.seconds += seconds
+
+        yield {"id": puzzle_id} | solution_record(
+            letters, solver, seconds, count_only=count_only
+        )
+
+
+def solution_record(
+    letters: str,
+    solver: Solver,
+    seconds: float,
+    *,
+    count_only: bool = False,
+    paths: bool = False,
+) -> dict[str, Any]:
+    """A solved puzzle as a JSON-ready dict.
+
+    Words are listed unless only counted. With paths, so are the paths for
+    each word.
+    """
+    record: dict[str, Any] = {
+        "letters": letters,
+        "word_count": solver.word_count(),
+        "path_count": solver.path_count(),
+        "seconds": round(seconds, 6),
+        "truncated": solver.solutions.truncated,
+    }
+    if not count_only:
+        record["words"] = solver.raw_solution_words()
+    if paths and not count_only:
+        record["paths"] = {
+            word: solver.solutions.paths(word) for word in record["words"]
+        }
+    return record
@@ -0,0 +1,245 @@
+"""Compiled DAWG (directed acyclic word graph) dictionaries.
+
+See https://en.wikipedia.org/wiki/Deterministic_acyclic_finite_state_automaton
+
+A word list squashed into a minimal DAWG and written out as a flat array of
+32-bit edges. Loading is a memory-map, so there's no parsing at all and every
+process solving puzzles shares the same pages.
+
+File layout (all little-endian):
+
+    header  8s magic, uint32 word count, uint32 edge count
+    edges   uint32 per edge
+
+Each edge packs:
+
+    bits 0-7    the letter (ASCII)
+    bit 8       following this edge spells a complete word
+    bit 9       last edge in this node's list
+    bits 10-31  index of the target node's first edge (0 if it has none)
+
+Edge 0 is a dummy so that a target of 0 can mean "no children". The root
+node's edges start at index 1.
+
+Classes
+    Dawg
+
+Functions
+    compile_dawg
+    is_dawg
+"""
+
+# self-referential _BuildNode type declaration
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+from array import array
+from collections import deque
+from collections.abc import Iterable
+from pathlib import Path
+
+from pysquaredle.trie import PrefixStatus
+
+DAWG_SUFFIX = ".dawg"
+
+_MAGIC = b"SQDAWG01"
+_HEADER = struct.Struct("<8sII")
+
+_CHAR_MASK = 0xFF
+_WORD_BIT = 1 << 8
+_LAST_BIT = 1 << 9
+_TARGET_SHIFT = 10
+_MAX_EDGES = 1 << (32 - _TARGET_SHIFT)
+
+BAD_MAGIC = "Not a compiled PySquaredle dictionary"
+TOO_BIG = "Word list too large for the DAWG format"
+BAD_LETTER = "DAWG words must be ASCII"
+
+
+class _BuildNode:
+    """A node in the DAWG under construction."""
+
+    __slots__ = ("edges", "final", "number")
+
+    def __init__(self) -> None:
+        self.edges: dict[str, _BuildNode] = {}
+        self.final = False
+        self.number = -1
+
+    def signature(self) -> tuple[bool, tuple[tuple[str, int], ...]]:
+        """Two nodes with the same signature accept the same suffixes."""
+        return (
+            self.final,
+            tuple((char, child.number) for char, child in sorted(self.edges.items())),
+        )
+
+
+class _Builder:
+    """Incremental DAWG construction from sorted words (Daciuk et al. 2000)."""
+
+    def __init__(self) -> None:
+        self.root = _BuildNode()
+        self.word_count = 0
+        self._previous = ""
+        self._unchecked: list[tuple[_BuildNode, str, _BuildNode]] = []
+        self._minimized: dict[tuple[bool, tuple[tuple[str, int], ...]], _BuildNode] = {}
+
+    def insert(self, word: str) -> None:
+        """Add word, which must sort after every word added so far."""
+        common = 0
+        for mine, theirs in zip(word, self._previous):
+            if mine != theirs:
+                break
+            common += 1
+
+        # everything below the shared prefix is finished with
+        self._minimize(common)
+
+        node = self._unchecked[-1][2] if self._unchecked else self.root
+        for char in word[common:]:
+            child = _BuildNode()
+            node.edges[char] = child
+            self._unchecked.append((node, char, child))
+            node = child
+
+        node.final = True
+        self.word_count += 1
+        self._previous = word
+
+    def finish(self) -> _BuildNode:
+        """Minimise whatever is left and hand back the root."""
+        self._minimize(0)
+        return self.root
+
+    def _minimize(self, down_to: int) -> None:
+        while len(self._unchecked) > down_to:
+            parent, char, child = self._unchecked.pop()
+            signature = child.signature()
+            if (existing := self._minimized.get(signature)) is not None:
+                parent.edges[char] = existing
+            else:
+                child.number = len(self._minimized)
+                self._minimized[signature] = child
+
+
+def compile_dawg(words: Iterable[str], path: str | Path) -> int:
+    """Write words to path as a compiled DAWG. Returns the number of words.
+
+    Words are upper-cased, stripped and de-duplicated on the way in.
+    """
+    builder = _Builder()
+    for word in sorted({w.strip().upper() for w in words} - {""}):
+        if not word.isascii():
+            raise ValueError(BAD_LETTER)
+        builder.insert(word)
+    root = builder.finish()
+
+    # lay out each node's edges contiguously, breadth first
+    starts: dict[int, int] = {}
+    order: list[_BuildNode] = []
+    queue = deque([root])
+    edge_count = 1
+    while queue:
+        node = queue.popleft()
+        if not node.edges or id(node) in starts:
+            continue
+        starts[id(node)] = edge_count
+        edge_count += len(node.edges)
+        order.append(node)
+        queue.extend(child for _, child in sorted(node.edges.items()))
+
+    if edge_count > _MAX_EDGES:
+        raise ValueError(TOO_BIG)
+
+    edges = array("I", [0])
+    for node in order:
+        children = sorted(node.edges.items())
+        for position, (char, child) in enumerate(children, start=1):
+            edge = ord(char) | (starts.get(id(child), 0) << _TARGET_SHIFT)
+            if child.final:
+                edge |= _WORD_BIT
+            if position == len(children):
+                edge |= _LAST_BIT
+            edges.append(edge)
+
+    if sys.byteorder != "little":
+        edges.byteswap()
+
+    with Path(path).open("wb") as dawg_file:
+        dawg_file.write(_HEADER.pack(_MAGIC, builder.word_count, len(edges)))
+        edges.tofile(dawg_file)
+
+    return builder.word_count
+
+
+def is_dawg(path: str | Path) -> bool:
+    """Does path look like a compiled dictionary rather than a word list."""
+    return Path(path).suffix == DAWG_SUFFIX
+
+
+class Dawg:
+    """A compiled DAWG, memory-mapped from disk and walked in place.
+
+    Node handles are the packed edge that led to the node, so asking about a
+    node's status never touches the file at all.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Map a compiled DAWG file."""
+        self.path = Path(path)
+        with self.path.open("rb") as dawg_file:
+            self._mmap = mmap.mmap(dawg_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.word_count: int
+        magic, self.word_count, edge_count = _HEADER.unpack_from(self._mmap)
+        if magic != _MAGIC:
+            raise ValueError(BAD_MAGIC)
+
+        raw = memoryview(self._mmap)[_HEADER.size :]
+        if sys.byteorder == "little":
+            self._edges: memoryview | array[int] = raw.cast("I")
+        else:
+            # no zero-copy on big-endian boxes, but still no text parsing
+            swapped = array("I")
+            swapped.frombytes(raw)
+            swapped.byteswap()
+            self._edges = swapped
+
+        self._root = (1 << _TARGET_SHIFT) if edge_count > 1 else 0
+
+    @property
+    def root(self) -> int:
+        """The node for the empty string."""
+        return self._root
+
+    def child(self, node: int, char: str) -> int | None:
+        """Step from node down to the child for char, if there is one."""
+        index = node >> _TARGET_SHIFT
+        if not index:
+            return None
+        code = ord(char)
+        edges = self._edges
+        while True:
+            edge = edges[index]
+            if edge & _CHAR_MASK == code:
+                return edge
+            if edge & _LAST_BIT:
+                return None
+            index += 1
+
+    def node_status(self, node: int) -> PrefixStatus:
+        """The PrefixStatus of the letters leading to node."""
+        return PrefixStatus.of(
+            word=bool(node & _WORD_BIT), prefix=bool(node >> _TARGET_SHIFT)
+        )
+
+    def status(self, target: str) -> PrefixStatus:
+        """Is target a word, the start of a word, both or neither."""
+        node: int | None = self._root
+        for char in target:
+            if node is None:
+                break
+            node = self.child(node, char)
+        return PrefixStatus.NOT_PREFIX if node is None else self.node_status(node)
@@ -0,0 +1,198 @@
+"""The words puzzles are solved against, loaded once and shared.
+
+A Dictionary wraps either a normalised WordList or a compiled Dawg. Loading
+it is the expensive part of solving, so it's done once and reused for as
+many puzzles as you like. For each puzzle it hands out the candidate words
+that could possibly fit, filtered on demand, and the word graph to search.
+
+Classes
+    Dictionary
+
+Functions
+    bigram_pattern
+    word_only_uses_bigrams
+    word_fits_letter_counts
+"""
+
+# self-referential Dictionary return type
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from collections import Counter, OrderedDict
+from collections.abc import Set
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+from pysquaredle.dawg import Dawg, is_dawg
+from pysquaredle.profiling import phase
+from pysquaredle.puzzle import Puzzle
+from pysquaredle.trie import CompactTrie, Trie, WordGraph
+from pysquaredle.word_list import WordList
+
+# how many sets of letters to remember the matching words for
+MATCHED_CACHE_SIZE = 16
+
+
+class Dictionary:
+    """A word list or compiled DAWG, ready to solve any number of puzzles."""
+
+    def __init__(self, words: WordList | Dawg, *, compact: bool = False) -> None:
+        """Wrap words that are already loaded.
+
+        Args:
+            words: WordList | Dawg  the acceptable words
+            compact: bool           build each puzzle's trie as a CompactTrie
+        """
+        self._words = words
+        self.compact = compact
+        # recent (letters, length) lookups and the words that matched
+        self._matched: OrderedDict[tuple[str, int], list[str]] = OrderedDict()
+        # puzzles can be solved on several threads at once, see server.py
+        self._matched_lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls, path: str | Path, *, use_cache: bool = True, compact: bool = False
+    ) -> Dictionary:
+        """Load a word list file (via the cache) or map a .dawg file."""
+        with phase("read"):
+            if is_dawg(path):
+                return cls(Dawg(path), compact=compact)
+            return cls(WordList.load(path, use_cache=use_cache), compact=compact)
+
+    @property
+    def word_count(self) -> int:
+        """Number of words, before any filtering for a puzzle."""
+        if isinstance(self._words, Dawg):
+            return self._words.word_count
+        return len(self._words)
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """A hash that changes whenever the words do.
+
+        A word list loaded via the cache already has its file's hash. Anything
+        else is hashed the first time it's asked for.
+        """
+        if isinstance(self._words, Dawg):
+            return hashlib.sha256(self._words.path.read_bytes()).hexdigest()
+        if self._words.digest:
+            return self._words.digest
+        return hashlib.sha256("\n".join(self._words.words).encode()).hexdigest()
+
+    @property
+    def dawg(self) -> Dawg | None:
+        """The compiled DAWG, if that's what we have."""
+        return self._words if isinstance(self._words, Dawg) else None
+
+    def candidates(
+        self, puzzle: Puzzle, *, through: int | None = None
+    ) -> list[str] | None:
+        """Words that might fit puzzle, or None for a DAWG.
+
+        With through, only words that could pass through that cell, ie those
+        with its letter in them. A DAWG isn't filtered at all: the search only
+        ever follows letters that are in the puzzle, so it's searched whole.
+        """
+        if isinstance(self._words, Dawg):
+            return None
+
+        words = self._matching(self._words, puzzle.unique_letters, puzzle.cell_count)
+        if through is not None:
+            letter = puzzle.letters[through]
+            words = [word for word in words if letter in word]
+        counts = puzzle.letter_counts
+        # one regex pass over every candidate beats checking bigrams per word
+        joined = "\n".join(words)
+        return [
+            word
+            for match in bigram_pattern(puzzle.unique_letters, puzzle.bigrams).finditer(
+                joined
+            )
+            if word_fits_letter_counts(word := match.group(), counts)
+        ]
+
+    def _matching(
+        self, word_list: WordList, letters: str, max_length: int
+    ) -> list[str]:
+        """WordList.matching, remembering the most recent answers.
+
+        Changing one cell of a puzzle at a time often leaves it with a set of
+        letters it has had before, so this saves scanning the whole word list
+        every change.
+        """
+        key = (letters, max_length)
+        with self._matched_lock:
+            if (matched := self._matched.get(key)) is not None:
+                self._matched.move_to_end(key)
+                return matched
+
+        matched = word_list.matching(letters, max_length)
+        with self._matched_lock:
+            self._matched[key] = matched
+            if len(self._matched) > MATCHED_CACHE_SIZE:
+                self._matched.popitem(last=False)
+        return matched
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle without the lock, or the matches, for worker processes."""
+        state = self.__dict__.copy()
+        del state["_matched_lock"]
+        state["_matched"] = OrderedDict()
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Unpickle with a lock of our own."""
+        self.__dict__.update(state)
+        self._matched_lock = threading.Lock()
+
+    def graph(self, candidates: list[str] | None) -> WordGraph[Any]:
+        """The word graph to search: the DAWG, or a trie of the candidates."""
+        if isinstance(self._words, Dawg):
+            return self._words
+        return build_trie(candidates or [], compact=self.compact)
+
+
+def build_trie(words: list[str], *, compact: bool) -> WordGraph[Any]:
+    """Put words into a new Trie or CompactTrie."""
+    trie = CompactTrie() if compact else Trie()
+    for word in words:
+        trie.insert(word)
+    return trie
+
+
+def bigram_pattern(letters: str, bigrams: Set[str]) -> re.Pattern[str]:
+    """A multiline regex matching whole lines that only use bigrams.
+
+    Equivalent to word_only_uses_bigrams on each line of words made from
+    letters, but the regex engine does the looping.
+    """
+    following: dict[str, set[str]] = {letter: set() for letter in letters}
+    for bigram in bigrams:
+        following[bigram[0]].add(bigram[1])
+    steps = "|".join(
+        (
+            f"{re.escape(letter)}(?=[{''.join(map(re.escape, sorted(after)))}]|$)"
+            if after
+            else f"{re.escape(letter)}$"
+        )
+        for letter, after in sorted(following.items())
+    )
+    return re.compile(f"^(?:{steps})+$", re.MULTILINE)
+
+
+def word_only_uses_bigrams(word: str, bigrams: Set[str]) -> bool:
+    """Check every adjacent pair of letters in a word is adjacent somewhere."""
+    return all(word[i : i + 2] in bigrams for i in range(len(word) - 1))
+
+
+def word_fits_letter_counts(word: str, counts: Counter[str]) -> bool:
+    """Check a word doesn't need more of any letter than there are."""
+    letters = set(word)
+    # words with no repeated letters are the norm, and always fit
+    return len(letters) == len(word) or all(
+        word.count(letter) <= counts[letter] for letter in letters
+    )
@@ -0,0 +1,274 @@
+"""Generate puzzles that hit a target number and spread of words.
+
+Generation is a local search: start from random letters (with a seed word
+laid along a random path, if there is one), then repeatedly swap two cells'
+letters or swap one letter for a new one, keeping the change if the puzzle
+is no further from the targets than before. Each change only re-solves the
+paths through the cells that changed (see resolve_cell), so hundreds of
+candidates can be tried a second.
+
+A climb that runs out of steps is followed by another from new random
+letters. Climbs are independent, so they can be run across a process pool,
+each worker loading the word list once.
+
+Classes
+    Targets
+    Generated
+
+Functions
+    generate
+    place_word
+"""
+
+import os
+import random
+import time
+from collections import Counter
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional
+
+from pysquaredle.dictionary import Dictionary
+from pysquaredle.puzzle import LETTER_BAG, Puzzle
+from pysquaredle.solutions import Solutions
+from pysquaredle.solver import resolve_cell, solve
+
+SEED_TOO_LONG = "Seed word has more letters than the grid has cells"
+NO_TARGETS = "Give a word count, length counts or a seed word to aim for"
+NO_RESTARTS = "Restarts must be at least 1"
+NEGATIVE_STEPS = "Steps can't be negative"
+
+# chance of swapping two cells rather than changing one cell's letter
+SWAP_CHANCE = 0.5
+
+
+@dataclass(frozen=True)
+class Targets:
+    """What a generated puzzle should look like.
+
+    Only words at least min_length long are counted. lengths maps a word
+    length to how many words of that length there should be.
+    """
+
+    words: Optional[int] = None  # noqa: UP007
+    seed_word: str = ""
+    lengths: Mapping[int, int] = field(default_factory=dict)
+    min_length: int = 4
+
+    def distance(self, solutions: Solutions) -> int:
+        """How far solutions are from the targets, 0 if they're all hit."""
+        found = [word for word in solutions.words() if len(word) >= self.min_length]
+        distance = 0
+        if self.words is not None:
+            distance += abs(len(found) - self.words)
+        if self.lengths:
+            by_length = Counter(map(len, found))
+            distance += sum(
+                abs(by_length[length] - count) for length, count in self.lengths.items()
+            )
+        return distance
+
+
+@dataclass
+class Generated:
+    """The best puzzle found, and how much work it took."""
+
+    letters: str
+    words: list[str]
+    distance: int
+    evaluated: int = 0
+    seconds: float = 0.0
+
+    @property
+    def per_second(self) -> float:
+        """Candidate puzzles evaluated per second."""
+        return self.evaluated / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        """One line for humans."""
+        return (
+            f"{len(self.words)} words, {self.distance} from target. "
+            f"{self.evaluated} candidates evaluated in {self.seconds:.3f}s "
+            f"({self.per_second:.1f} candidates/s)"
+        )
+
+
+def generate(
+    word_list: str | Dictionary,
+    side: int,
+    targets: Targets,
+    *,
+    steps: int = 500,
+    restarts: int = 1,
+    workers: int = 1,
+    seed: Optional[int] = None,  # noqa: UP007
+    use_cache: bool = True,
+) -> Generated:
+    """Search for a side x side puzzle that meets targets.
+
+    Runs up to restarts climbs of up to steps changes each, stopping as soon
+    as one hits every target, and returns the closest puzzle found. With
+    more than one worker (0 for one per CPU) the climbs run in parallel, so a
+    word list path is better than a Dictionary, which would have to be copied
+    to each worker. A Dictionary of a .dawg file has each worker map the file
+    again instead.
+    seed makes the result repeatable, for a given number of workers.
+    """
+    seed_word = targets.seed_word.upper()
+    if len(seed_word) > side * side:
+        raise ValueError(SEED_TOO_LONG)
+    if targets.words is None and not targets.lengths and not seed_word:
+        raise ValueError(NO_TARGETS)
+    if restarts < 1:
+        raise ValueError(NO_RESTARTS)
+    if steps < 0:
+        raise ValueError(NEGATIVE_STEPS)
+
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    rng = random.Random(seed)
+    seeds = [rng.getrandbits(32) for _ in range(restarts)]
+
+    results: list[Generated] = []
+    if workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_start_worker,
+            initargs=(_for_workers(word_list), use_cache),
+        ) as pool:
+            for result in pool.map(
+                _climb_in_worker, [(side, targets, steps, each) for each in seeds]
+            ):
+                results.append(result)
+                if not result.distance:
+                    pool.shutdown(cancel_futures=True)
+                    break
+    else:
+        dictionary = (
+            word_list
+            if isinstance(word_list, Dictionary)
+            else Dictionary.load(word_list, use_cache=use_cache)
+        )
+        for each in seeds:
+            results.append(_climb(dictionary, side, targets, steps, each))
+            if not results[-1].distance:
+                break
+
+    best = min(results, key=lambda result: result.distance)
+    best.evaluated = sum(result.evaluated for result in results)
+    best.seconds = time.perf_counter() - start
+    return best
+
+
+def place_word(word: str, side: int, rng: random.Random) -> list[int] | None:
+    """A random path of len(word) cells through a side x side grid.
+
+    None if the word can't fit.
+    """
+    neighbours = Puzzle("_" * side * side)
+    cells = list(range(side * side))
+    rng.shuffle(cells)
+
+    def extend(path: list[int]) -> list[int] | None:
+        if len(path) == len(word):
+            return path
+        following = [
+            cell for cell in neighbours.neighbours_of(path[-1]) if cell not in path
+        ]
+        rng.shuffle(following)
+        for cell in following:
+            if (found := extend([*path, cell])) is not None:
+                return found
+        return None
+
+    for cell in cells:
+        if (found := extend([cell])) is not None:
+            return found
+    return None
+
+
+def _climb(
+    dictionary: Dictionary, side: int, targets: Targets, steps: int, seed: int
+) -> Generated:
+    """One climb from random letters, changing a cell or two at a time."""
+    rng = random.Random(seed)
+    letters = rng.choices(LETTER_BAG, k=side * side)
+    fixed: set[int] = set()
+    if seed_word := targets.seed_word.upper():
+        if (path := place_word(seed_word, side, rng)) is None:
+            raise ValueError(SEED_TOO_LONG)
+        for cell, letter in zip(path, seed_word, strict=True):
+            letters[cell] = letter
+        fixed.update(path)
+    free = [cell for cell in range(side * side) if cell not in fixed]
+
+    puzzle = Puzzle("".join(letters))
+    solutions = solve(dictionary, puzzle)
+    distance = targets.distance(solutions)
+    evaluated = 1
+
+    for _ in range(steps):
+        if not distance or not free:
+            break
+
+        candidate, changed = puzzle, solutions
+        if len(free) > 1 and rng.random() < SWAP_CHANCE:
+            first, second = rng.sample(free, 2)
+            if puzzle.letters[first] == puzzle.letters[second]:
+                continue
+            candidate, changed = resolve_cell(
+                dictionary, candidate, changed, first, puzzle.letters[second]
+            )
+            candidate, changed = resolve_cell(
+                dictionary, candidate, changed, second, puzzle.letters[first]
+            )
+        else:
+            cell = rng.choice(free)
+            letter = rng.choice(LETTER_BAG)
+            if letter == puzzle.letters[cell]:
+                continue
+            candidate, changed = resolve_cell(
+                dictionary, candidate, changed, cell, letter
+            )
+
+        evaluated += 1
+        if (closer := targets.distance(changed)) <= distance:
+            puzzle, solutions, distance = candidate, changed, closer
+
+    return Generated(
+        letters=puzzle.letters,
+        words=[word for word in solutions.words() if len(word) >= targets.min_length],
+        distance=distance,
+        evaluated=evaluated,
+    )
+
+
+# the dictionary each pool worker climbs with, loaded once per worker
+_worker: dict[str, Dictionary] = {}
+
+
+def _for_workers(word_list: str | Dictionary) -> str | Dictionary:
+    """What to send to each worker process for them to load.
+
+    A Dawg holds a memory map, which can't be pickled, but its file can be
+    mapped again.
+    """
+    if isinstance(word_list, Dictionary) and (dawg := word_list.dawg) is not None:
+        return str(dawg.path)
+    return word_list
+
+
+def _start_worker(word_list: str | Dictionary, use_cache: bool) -> None:
+    """Pool initializer: load the word list once per worker process."""
+    _worker["dictionary"] = (
+        word_list
+        if isinstance(word_list, Dictionary)
+        else Dictionary.load(word_list, use_cache=use_cache)
+    )
+
+
+def _climb_in_worker(job: tuple[int, Targets, int, int]) -> Generated:
+    """Pool task: one climb with the worker's dictionary."""
+    side, targets, steps, seed = job
+    return _climb(_worker["dictionary"], side, targets, steps, seed)
@@ -6,8 +6,14 @@ import random
 import sys
 
 from pysquaredle.console import console
+from pysquaredle.generator import Targets
+from pysquaredle.puzzle import LETTER_BAG
+from pysquaredle.server import DEFAULT_PORT
+from pysquaredle.solver import SearchOptions, Strategy
 from pysquaredle.web import get_letters_from_web
 
+BAD_LENGTH_COUNTS = "expected LENGTH:N pairs separated by commas, eg 7:3,8:1"
+
 
 def puzzle_letters(args: argparse.Namespace) -> str:
     """Use the arguments to determine the letters to use."""
@@ -53,6 +59,35 @@ def parse_args() -> argparse.Namespace:
         " with scrabble",
         type=int,
     )
+    group.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="solve every puzzle in FILE ('-' for stdin), one per line as "
+        'letters or JSON with a "letters" key. Results are written as JSON '
+        "lines, timings to stderr. The word list is only loaded once",
+    )
+    group.add_argument(
+        "--serve",
+        nargs="?",
+        const=str(DEFAULT_PORT),
+        metavar="PORT|SOCKET",
+        help="keep the word list loaded and solve puzzles sent as JSON to "
+        "http://localhost:PORT/solve (default port: %(const)s), or to a "
+        "Unix SOCKET path. See pysquaredle/server.py for the requests",
+    )
+    group.add_argument(
+        "--replay",
+        metavar="TRACE",
+        help="play back a search recorded with --trace, as --slow-mode "
+        "would have shown it",
+    )
+    group.add_argument(
+        "--generate",
+        metavar="SIDE",
+        type=int,
+        help="generate a SIDE by SIDE puzzle that meets the generator targets "
+        "(see below). Words shorter than --min-length aren't counted",
+    )
 
     output_group = parser.add_argument_group("output options")
 
@@ -102,6 +137,19 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="sort solutions alphabetically (default: %(default)s)",
     )
+    output_group.add_argument(
+        "--stats",
+        action="store_true",
+        help="only show how many words and paths there are. Counts paths "
+        "without listing them, so much faster on busy grids "
+        "(default: %(default)s)",
+    )
+    output_group.add_argument(
+        "--stream",
+        action="store_true",
+        help="print each word as soon as it is found, one per line. Ignores "
+        "sorting and grouping options (default: %(default)s)",
+    )
     output_group.add_argument(
         "-u",
         "--gui",
@@ -145,28 +193,215 @@ def parse_args() -> argparse.Namespace:
     advanced_group.add_argument(
         "-f",
         "--file",
-        help="specify word list (default: %(default)s)",
+        help="specify word list, or a compiled .dawg dictionary "
+        "(default: %(default)s)",
         default="./word_list.txt",
     )
+    advanced_group.add_argument(
+        "--also-load",
+        action="append",
+        default=[],
+        metavar="FILE",
+        help="for --serve, another word list or .dawg to keep loaded. Requests "
+        "pick one by file name without extension. Can be repeated",
+    )
+    advanced_group.add_argument(
+        "--compile",
+        metavar="DAWG",
+        help="compile the --file word list into a .dawg dictionary and exit. "
+        "Pass the result to --file for near-instant start up",
+    )
+    advanced_group.add_argument(
+        "--compact",
+        action="store_true",
+        help="hold the word list in a compact array-backed trie. Much less "
+        "memory for big word lists (default: %(default)s)",
+    )
+    advanced_group.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="solve using this many processes, 0 for one per CPU. Progress "
+        "(--slow-mode) is only shown for a single process (default: %(default)s)",
+    )
+    advanced_group.add_argument(
+        "--strategy",
+        choices=[str(strategy) for strategy in Strategy],
+        default=str(Strategy.AUTO),
+        help="search out from each cell of the grid, or trace each candidate "
+        "word on the grid. auto picks by number of candidates for the grid "
+        "size. A .dawg word list is always searched grid-first "
+        "(default: %(default)s)",
+    )
+    advanced_group.add_argument(
+        "--cache-results",
+        action="store_true",
+        help="keep solutions alongside the word list cache, so solving the "
+        "same puzzle with the same word list and limits again is instant "
+        "(default: %(default)s)",
+    )
+    advanced_group.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="don't read or write the preprocessed word list cache",
+    )
     advanced_group.add_argument(
         "-z",
         "--slow-mode",
         action="store_true",
-        help="show progress as it goes (default: %(default)s)",
+        help="show progress as it goes, every step. Only bearable on small "
+        "grids, see --progress (default: %(default)s)",
+    )
+    advanced_group.add_argument(
+        "--progress",
+        type=float,
+        nargs="?",
+        const=1.0,
+        metavar="SECONDS",
+        help="count the steps of the search, showing the counts every "
+        "SECONDS (default: 1) and when done. Searches grid-first",
+    )
+    advanced_group.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="record every step of the search to a binary FILE, for --replay. "
+        "Searches grid-first",
+    )
+
+    profile_group = parser.add_argument_group(
+        "profiling", "where the time and memory go, reported to stderr"
+    )
+    profile_group.add_argument(
+        "--profile",
+        action="store_true",
+        help="time each phase (start up, fetch, read, filter, trie, search, "
+        "sort, render) and trace its peak memory. Tracing memory slows "
+        "everything down, so compare with other profiled runs "
+        "(default: %(default)s)",
+    )
+    profile_group.add_argument(
+        "--profile-stats",
+        metavar="FILE",
+        help="profile and also dump cProfile stats to FILE, for pstats",
+    )
+    profile_group.add_argument(
+        "--profile-json",
+        metavar="FILE",
+        help="profile and also append the timings to FILE as a JSON line",
+    )
+
+    limits_group = parser.add_argument_group(
+        "search limits", "stop early for quicker, partial results"
+    )
+    limits_group.add_argument(
+        "--first-path-only",
+        action="store_true",
+        help="only record the first path found for each word (default: %(default)s)",
+    )
+    limits_group.add_argument(
+        "--max-words",
+        type=int,
+        metavar="N",
+        help="stop after finding N different words",
+    )
+    limits_group.add_argument(
+        "--min-length",
+        type=int,
+        default=1,
+        metavar="N",
+        help="ignore words shorter than N letters. Squaredle wants 4 "
+        "(default: %(default)s)",
+    )
+    limits_group.add_argument(
+        "--time-budget",
+        type=float,
+        metavar="SECONDS",
+        help="give up after SECONDS and show what has been found",
+    )
+
+    generator_group = parser.add_argument_group(
+        "generator targets", "what --generate aims for"
+    )
+    generator_group.add_argument(
+        "--target-words",
+        type=int,
+        metavar="N",
+        help="aim for N different words",
+    )
+    generator_group.add_argument(
+        "--target-lengths",
+        type=length_counts,
+        default={},
+        metavar="LENGTH:N,...",
+        help="aim for N words of each LENGTH, eg 7:3,8:1",
+    )
+    generator_group.add_argument(
+        "--seed-word",
+        default="",
+        metavar="WORD",
+        help="make sure WORD is in the puzzle",
+    )
+    generator_group.add_argument(
+        "--steps",
+        type=int,
+        default=500,
+        metavar="N",
+        help="change the letters up to N times per attempt (default: %(default)s)",
+    )
+    generator_group.add_argument(
+        "--restarts",
+        type=int,
+        default=4,
+        metavar="N",
+        help="make up to N attempts from fresh letters. --jobs runs them in "
+        "parallel (default: %(default)s)",
+    )
+    generator_group.add_argument(
+        "--random-seed",
+        type=int,
+        metavar="N",
+        help="seed the generator, for repeatable puzzles",
     )
 
     return parser.parse_args()
 
 
+def length_counts(text: str) -> dict[int, int]:
+    """Parse "LENGTH:N,..." into a mapping of word length to count."""
+    try:
+        return {
+            int(length): int(count)
+            for length, count in (pair.split(":") for pair in text.split(","))
+        }
+    except ValueError as error:
+        raise argparse.ArgumentTypeError(BAD_LENGTH_COUNTS) from error
+
+
+def generator_targets(args: argparse.Namespace) -> Targets:
+    """Gather the generator targets from the arguments."""
+    return Targets(
+        words=args.target_words,
+        seed_word=args.seed_word,
+        lengths=args.target_lengths,
+        min_length=args.min_length,
+    )
+
+
+def search_options(args: argparse.Namespace) -> SearchOptions:
+    """Gather the search limits from the arguments."""
+    return SearchOptions(
+        first_path_only=args.first_path_only,
+        max_words=args.max_words,
+        min_length=args.min_length,
+        time_budget=args.time_budget,
+    )
+
+
 def random_letters(count: int) -> str:
     """Generate a string of count nicely distributed random letters."""
-    return "".join(
-        random.sample(
-            "EEEEEEEEEEEEEEEEAAAAAAAAAIIIIIIIIIOOOOOOOONNNNNN"
-            "RRRRRRTTTTTTLLLLSSSSUUUDDDDGGGBBCCMMPPFFHHVVWWYYKJXQZ",
-            count,
-        )
-    )
+    return "".join(random.sample(LETTER_BAG, count))
 
 
 def shuffle(letters: str) -> str:
@@ -0,0 +1,208 @@
+"""Where the time and memory go, phase by phase.
+
+Code marks out a phase with `with phase("search"):`. Outside a Profile
+that costs next to nothing, so phases are marked in the library itself:
+reading the word list, filtering it for a puzzle, building the trie and
+searching. Inside `with Profile():` each phase's wall time and peak traced
+memory are added up by name, in the order the phases first ran.
+
+Phases can nest. A phase's time doesn't include the phases inside it, so
+the times add up to the total, but its peak memory does.
+
+Classes
+    Phase
+    Profile
+
+Functions
+    phase
+"""
+
+# self-referential Profile return type
+from __future__ import annotations
+
+import cProfile
+import json
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+MEGABYTE = 1024 * 1024
+
+# the Profile phases are being recorded for, if any
+_active: list[Profile] = []
+
+
+@dataclass
+class Phase:
+    """Totals for one named phase. peak_bytes is None if memory wasn't traced."""
+
+    name: str
+    seconds: float = 0.0
+    peak_bytes: int | None = None
+    calls: int = 0
+
+
+@dataclass
+class _Running:
+    """A phase under way."""
+
+    started: float
+    # time spent in phases inside this one
+    inner_seconds: float = 0.0
+    peak_bytes: int = 0
+
+
+class Profile:
+    """Record phases, and optionally everything else with cProfile.
+
+    Use as a context manager around the work to profile. Memory is traced
+    with tracemalloc, which slows everything down a good deal, so the times
+    are best compared with other profiled runs.
+    """
+
+    def __init__(
+        self, *, trace_memory: bool = True, stats_path: str | Path | None = None
+    ) -> None:
+        """Get ready to profile.
+
+        Args:
+            trace_memory: bool  record the peak memory of each phase
+            stats_path: str     dump cProfile stats here when done, for pstats
+        """
+        self.phases: dict[str, Phase] = {}
+        self._trace_memory = trace_memory
+        self._stats_path = stats_path
+        self._profiler = cProfile.Profile() if stats_path else None
+        # the phases under way, innermost last
+        self._running: list[_Running] = []
+
+    def record(self, name: str, seconds: float, peak_bytes: int | None = None) -> None:
+        """Add a phase timed some other way, eg before profiling could start."""
+        self._add(name, seconds, peak_bytes)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time (and trace) everything in the with block as phase name."""
+        if self._running:
+            self._update_peak(self._running[-1])
+        if self._trace_memory:
+            tracemalloc.reset_peak()
+
+        running = _Running(time.perf_counter())
+        self._running.append(running)
+        try:
+            yield
+        finally:
+            self._running.pop()
+            seconds = time.perf_counter() - running.started
+            self._update_peak(running)
+            self._add(
+                name,
+                seconds - running.inner_seconds,
+                running.peak_bytes if self._trace_memory else None,
+            )
+            if self._running:
+                outer = self._running[-1]
+                outer.inner_seconds += seconds
+                outer.peak_bytes = max(outer.peak_bytes, running.peak_bytes)
+
+    @property
+    def seconds(self) -> float:
+        """Total time in all the phases."""
+        return sum(each.seconds for each in self.phases.values())
+
+    @property
+    def peak_bytes(self) -> int | None:
+        """Highest peak of any phase, None if memory wasn't traced."""
+        peaks = [p.peak_bytes for p in self.phases.values() if p.peak_bytes is not None]
+        return max(peaks) if peaks else None
+
+    def report(self) -> str:
+        """A table of the phases for humans."""
+        lines = [f"{'phase':<12}{'calls':>6}{'seconds':>10}{'peak MB':>10}"]
+        lines.extend(
+            f"{each.name:<12}{each.calls:>6}{each.seconds:>10.4f}"
+            f"{_megabytes(each.peak_bytes):>10}"
+            for each in self.phases.values()
+        )
+        lines.append(
+            f"{'total':<12}{'':>6}{self.seconds:>10.4f}"
+            f"{_megabytes(self.peak_bytes):>10}"
+        )
+        return "\n".join(lines)
+
+    def as_dict(self) -> dict[str, Any]:
+        """JSON-ready totals and phases."""
+        return {
+            "seconds": round(self.seconds, 6),
+            "peak_bytes": self.peak_bytes,
+            "phases": [
+                asdict(each) | {"seconds": round(each.seconds, 6)}
+                for each in self.phases.values()
+            ],
+        }
+
+    def append_json(self, path: str | Path, **extra: Any) -> None:
+        """Append this profile to path as one JSON line, with extra fields.
+
+        Keeping every run in one file gives a history to spot regressions in.
+        """
+        record = {"time": time.strftime("%Y-%m-%dT%H:%M:%S%z"), **extra}
+        with Path(path).open("a", encoding="utf-8") as records:
+            records.write(json.dumps(record | self.as_dict()) + "\n")
+
+    def __enter__(self) -> Profile:
+        """Start recording phases, tracing memory and profiling if asked."""
+        _active.append(self)
+        if self._trace_memory:
+            tracemalloc.start()
+        if self._profiler:
+            self._profiler.enable()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop everything and write out the cProfile stats."""
+        if self._profiler:
+            self._profiler.disable()
+            self._profiler.dump_stats(str(self._stats_path))
+        if self._trace_memory:
+            tracemalloc.stop()
+        _active.remove(self)
+
+    def _update_peak(self, running: _Running) -> None:
+        """Fold the peak since the last reset into running's peak."""
+        if self._trace_memory:
+            running.peak_bytes = max(
+                running.peak_bytes, tracemalloc.get_traced_memory()[1]
+            )
+
+    def _add(self, name: str, seconds: float, peak_bytes: int | None) -> None:
+        totals = self.phases.setdefault(name, Phase(name))
+        totals.seconds += seconds
+        totals.calls += 1
+        if peak_bytes is not None:
+            totals.peak_bytes = max(totals.peak_bytes or 0, peak_bytes)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Record the with block as phase name of the active Profile, if any."""
+    if not _active:
+        yield
+        return
+    with _active[-1].phase(name):
+        yield
+
+
+def _megabytes(size: int | None) -> str:
+    return "-" if size is None else f"{size / MEGABYTE:.2f}"
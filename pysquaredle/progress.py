@@ -0,0 +1,208 @@
+"""Watching a grid-first search without slowing it to a crawl.
+
+Anything matching solver.ProgressReporter can watch a search: it's called
+with the letters so far, the path and the PrefixStatus for every node the
+search reaches. Printing each one is only bearable on tiny grids, so here
+are two cheaper watchers:
+
+- SearchMetrics keeps counters and hands a one-line summary to its output
+  no more often than every interval seconds.
+- TraceWriter writes every node to a compact binary file, which read_trace
+  plays back later through any reporter.
+
+Trace file layout (all little-endian):
+
+    header  8s magic, uint16 letter count, then the puzzle letters (ASCII)
+    nodes   uint8 depth, uint16 cell, uint8 PrefixStatus per node
+
+A node's path is the previous node's path cut to depth - 1 cells, plus its
+cell, which is how the depth-first search moves anyway.
+
+Classes
+    SearchMetrics
+    TraceWriter
+
+Functions
+    fan_out
+    read_trace
+"""
+
+# self-referential TraceWriter return type
+from __future__ import annotations
+
+import struct
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, Optional
+
+from pysquaredle.puzzle import Puzzle
+from pysquaredle.solver import ProgressReporter
+from pysquaredle.trie import PrefixStatus
+
+# how many nodes to count between looking at the clock
+THROTTLE_CHECK_NODES = 1024
+# how much trace to buffer before writing it out
+TRACE_BUFFER_BYTES = 1 << 16
+
+_MAGIC = b"SQTRACE1"
+_HEADER = struct.Struct("<8sH")
+_NODE = struct.Struct("<BHB")
+
+BAD_TRACE = "Not a PySquaredle search trace"
+
+
+class SearchMetrics:
+    """Counters for a grid-first search, reported on a time-based throttle.
+
+    Attributes:
+        nodes           word graph nodes the search reached
+        lookups         letters looked up in the word graph from those nodes
+        dead_ends       nodes no word continues on from
+        words_by_depth  words found, by length of path
+    """
+
+    def __init__(
+        self,
+        puzzle: Puzzle,
+        output: Optional[Callable[[str], None]] = None,  # noqa: UP007
+        interval: float = 1.0,
+    ) -> None:
+        """Count the search of puzzle.
+
+        Args:
+            puzzle: Puzzle      the puzzle being searched
+            output: fn          given the summary every interval, if at all
+            interval: float     least seconds between summaries
+        """
+        self.nodes = 0
+        self.lookups = 0
+        self.dead_ends = 0
+        self.words_by_depth: Counter[int] = Counter()
+        self._neighbours = [
+            puzzle.neighbours_of(cell) for cell in range(puzzle.cell_count)
+        ]
+        self._output = output
+        self._interval = interval
+        self._start = time.perf_counter()
+        self._next_output = self._start + interval
+        self._until_check = THROTTLE_CHECK_NODES
+
+    def __call__(self, word: str, path: list[int], status: PrefixStatus) -> None:
+        """Count one node. A ProgressReporter."""
+        self.nodes += 1
+        if status & PrefixStatus.WORD:
+            self.words_by_depth[len(path)] += 1
+        if status & PrefixStatus.PREFIX:
+            # the search tries every neighbour not already on the path
+            self.lookups += sum(cell not in path for cell in self._neighbours[path[-1]])
+        else:
+            self.dead_ends += 1
+
+        self._until_check -= 1
+        if not self._until_check:
+            self._until_check = THROTTLE_CHECK_NODES
+            if self._output and (now := time.perf_counter()) >= self._next_output:
+                self._next_output = now + self._interval
+                self._output(self.summary())
+
+    def summary(self) -> str:
+        """One line for humans."""
+        seconds = time.perf_counter() - self._start
+        depths = " ".join(
+            f"{depth}:{count}" for depth, count in sorted(self.words_by_depth.items())
+        )
+        return (
+            f"{seconds:.1f}s: {self.nodes} nodes, {self.lookups} lookups, "
+            f"{self.dead_ends} dead ends, word paths by length {depths or 'none'}"
+        )
+
+    def finish(self) -> None:
+        """Report the final counts, whatever the throttle says."""
+        if self._output:
+            self._output(self.summary())
+
+
+class TraceWriter:
+    """Write every node of a search to a binary trace file. A ProgressReporter.
+
+    Use as a context manager, or close when done, to write out the buffer.
+    """
+
+    def __init__(self, path: str | Path, puzzle: Puzzle) -> None:
+        """Start a trace of searching puzzle at path, replacing any file there."""
+        self._file: BinaryIO = Path(path).open("wb")
+        letters = puzzle.letters.encode("ascii")
+        self._buffer = bytearray(_HEADER.pack(_MAGIC, len(letters)) + letters)
+        self._pack = _NODE.pack
+
+    def __call__(self, word: str, path: list[int], status: PrefixStatus) -> None:
+        """Record one node."""
+        self._buffer += self._pack(len(path), path[-1], status)
+        if len(self._buffer) >= TRACE_BUFFER_BYTES:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+
+    def close(self) -> None:
+        """Write out what's buffered and close the file."""
+        self._file.write(self._buffer)
+        self._buffer.clear()
+        self._file.close()
+
+    def __enter__(self) -> TraceWriter:
+        """Nothing more to set up."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the trace."""
+        self.close()
+
+
+def read_trace(
+    path: str | Path,
+) -> tuple[Puzzle, Iterator[tuple[str, list[int], PrefixStatus]]]:
+    """Open a trace file for replay.
+
+    Returns the puzzle that was searched, and an iterator of what the
+    reporter was called with, in order.
+    """
+    data = Path(path).read_bytes()
+    if len(data) < _HEADER.size:
+        raise ValueError(BAD_TRACE)
+    magic, length = _HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError(BAD_TRACE)
+    letters = data[_HEADER.size : _HEADER.size + length].decode("ascii")
+
+    def nodes() -> Iterator[tuple[str, list[int], PrefixStatus]]:
+        cells: list[int] = []
+        for depth, cell, status in _NODE.iter_unpack(data[_HEADER.size + length :]):
+            del cells[depth - 1 :]
+            cells.append(cell)
+            word = "".join(letters[each] for each in cells)
+            yield word, cells.copy(), PrefixStatus(status)
+
+    return Puzzle(letters), nodes()
+
+
+def fan_out(
+    reporters: list[ProgressReporter],
+) -> Optional[ProgressReporter]:  # noqa: UP007
+    """One reporter that calls each of reporters, or None if there aren't any."""
+    if not reporters:
+        return None
+    if len(reporters) == 1:
+        return reporters[0]
+
+    def report(word: str, path: list[int], status: PrefixStatus) -> None:
+        for reporter in reporters:
+            reporter(word, path, status)
+
+    return report
@@ -1,11 +1,30 @@
 """Represent Squaredle puzzles."""
 
+# self-referential Puzzle return type
+from __future__ import annotations
+
 import math
 import re
+from collections import Counter
+from functools import cached_property
 
 ALPHA_ONLY = "Letters must be alphabetic"
 LONG_ENOUGH = "Puzzle must have at least four letters"
 SQUARE_PUZZLE = "Puzzle must have a square number of letters eg 2x2, 3x3"
+ONE_LETTER = "Replace a cell with a single letter"
+NO_SUCH_CELL = "Cell is not in the puzzle"
+NO_SUCH_SYMMETRY = "Symmetries are numbered 0 to 7"
+
+# a square grid's rotations and reflections: 0-3 are that many clockwise
+# quarter turns, 4-7 the same followed by a flip left to right
+SYMMETRIES = range(8)
+
+# letters to draw random grids from, in the proportions of a popular
+# grid-based word game rhyming with scrabble
+LETTER_BAG = (
+    "EEEEEEEEEEEEEEEEAAAAAAAAAIIIIIIIIIOOOOOOOONNNNNN"
+    "RRRRRRTTTTTTLLLLSSSSUUUDDDDGGGBBCCMMPPFFHHVVWWYYKJXQZ"
+)
 
 
 class Puzzle:
@@ -50,6 +69,20 @@ class Puzzle:
         """A sorted string of unique letters in the puzzle."""
         return "".join(sorted(set(self._letters)))
 
+    @cached_property
+    def letter_counts(self) -> Counter[str]:
+        """How many times each letter appears in the puzzle."""
+        return Counter(self._letters)
+
+    @cached_property
+    def bigrams(self) -> frozenset[str]:
+        """Every pair of letters that sit in neighbouring cells, in both orders."""
+        return frozenset(
+            self._letters[cell] + self._letters[neighbour]
+            for cell, neighbours in enumerate(self._neighbours)
+            for neighbour in neighbours
+        )
+
     @property
     def grid(self) -> str:
         """Convert the puzzle grid to a string."""
@@ -60,6 +93,53 @@ class Puzzle:
             grid = "".join([grid, self._letters[start:end], "\n"])
         return grid
 
+    def with_letter(self, cell: int, letter: str) -> Puzzle:
+        """A copy of this puzzle with the letter in cell replaced."""
+        if len(letter) != 1:
+            raise ValueError(ONE_LETTER)
+        if not 0 <= cell < self.cell_count:
+            raise ValueError(NO_SUCH_CELL)
+        return Puzzle(self._letters[:cell] + letter + self._letters[cell + 1 :])
+
+    def cell_map(self, symmetry: int) -> list[int]:
+        """Where each cell ends up when the grid is turned or flipped.
+
+        Neighbours stay neighbours, so mapping each cell of a path through
+        this puzzle gives a path spelling the same word through
+        transformed(symmetry).
+        """
+        if symmetry not in SYMMETRIES:
+            raise ValueError(NO_SUCH_SYMMETRY)
+        last = self.side_length - 1
+        cells = []
+        for cell in range(self.cell_count):
+            y, x = self._coord(cell)
+            for _ in range(symmetry % 4):
+                x, y = last - y, x
+            if symmetry >= len(SYMMETRIES) // 2:
+                x = last - x
+            cells.append(self._idx(x, y))
+        return cells
+
+    def transformed(self, symmetry: int) -> Puzzle:
+        """A copy of this puzzle turned or flipped, see cell_map."""
+        letters = [""] * self.cell_count
+        for cell, moved in enumerate(self.cell_map(symmetry)):
+            letters[moved] = self._letters[cell]
+        return Puzzle("".join(letters))
+
+    @cached_property
+    def canonical_symmetry(self) -> int:
+        """The symmetry that gives the alphabetically first letters."""
+        return min(SYMMETRIES, key=lambda symmetry: self.transformed(symmetry).letters)
+
+    def canonical(self) -> Puzzle:
+        """The same puzzle for all eight rotations and reflections of this one.
+
+        They all have the same words, with paths related by cell_map.
+        """
+        return self.transformed(self.canonical_symmetry)
+
     def neighbours_of(self, cell: int) -> list[int]:
         """Return a list of neighbours for the referenced cell."""
         return self._neighbours[cell]
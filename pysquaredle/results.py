@@ -28,6 +28,11 @@ def output_formatted_results(
         _output_block(list(group), single_column=single_column)
 
 
+def output_streamed_word(word: str) -> None:
+    """Output a single result the moment it's found."""
+    console.print(_emojify(word))
+
+
 def _output_block(words: list[str], *, single_column: bool = False) -> None:
     emojied = [_emojify(word) for word in words]
     if not single_column:
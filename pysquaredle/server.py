@@ -0,0 +1,251 @@
+"""A long-lived solver that keeps its word lists loaded.
+
+Loading a big word list takes far longer than solving a puzzle with it, so
+the daemon loads each word list once and then answers solve requests over
+HTTP, on a localhost port or a Unix socket, one thread per request:
+
+    GET  /word-lists    the word lists loaded, by name, with word counts
+    GET  /cache         solution cache hits, misses and size
+    POST /solve         solve the puzzle described by the JSON body
+
+A solve request looks like:
+
+    {"letters": "GACSNEWID", "word_list": "word_list", "paths": false,
+     "count_only": false, "strategy": "auto",
+     "options": {"min_length": 4, "max_words": 100}}
+
+Only letters is needed. word_list is the file name without its extension
+and defaults to the first one loaded. options are SearchOptions fields. The
+answer is a JSON object, see batch.solution_record, or {"error": ...} with
+a 400 status if the request doesn't make sense.
+
+Classes
+    SolveService
+
+Functions
+    search_options
+    make_server
+    serve
+"""
+
+# self-referential SolveService return type
+from __future__ import annotations
+
+import json
+import socketserver
+import time
+from collections.abc import Iterable
+from functools import partial
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+from pysquaredle.batch import solution_record
+from pysquaredle.dictionary import Dictionary
+from pysquaredle.puzzle import Puzzle
+from pysquaredle.solution_cache import SolutionCache
+from pysquaredle.solver import SearchOptions, Solver, Strategy
+
+LOCALHOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# the most request body we'll read
+MAX_REQUEST_BYTES = 1 << 16
+
+NO_SUCH_WORD_LIST = "No word list of that name is loaded"
+BAD_REQUEST = "Requests must be a JSON object with a letters string"
+BAD_OPTIONS = "Unknown search options"
+BAD_OPTION_TYPE = "Search option {} must be {}"
+BAD_WORD_LIST = "word_list must be a string"
+BAD_LENGTH = "Content-Length must be a number"
+TOO_BIG = "Request too large"
+NO_SUCH_PATH = "Not found"
+
+# what each SearchOptions field may be, in JSON terms, and the types for it
+OPTION_TYPES: dict[str, tuple[str, tuple[type, ...]]] = {
+    "first_path_only": ("true or false", (bool,)),
+    "max_words": ("a whole number or null", (int, type(None))),
+    "min_length": ("a whole number", (int,)),
+    "time_budget": ("a number or null", (int, float, type(None))),
+}
+
+
+class SolveService:
+    """Loaded word lists, and solving requests against them."""
+
+    def __init__(
+        self,
+        dictionaries: dict[str, Dictionary],
+        cache: SolutionCache | None = None,
+    ) -> None:
+        """Serve dictionaries, by name. The first is the default.
+
+        Puzzles already in cache are answered from it, others are added.
+        """
+        self.dictionaries = dictionaries
+        self.cache = cache
+
+    @classmethod
+    def load(
+        cls,
+        paths: Iterable[str],
+        *,
+        use_cache: bool = True,
+        compact: bool = False,
+        cache: SolutionCache | None = None,
+    ) -> SolveService:
+        """Load each word list (or .dawg), named after the file."""
+        return cls(
+            {
+                Path(path).stem: Dictionary.load(
+                    path, use_cache=use_cache, compact=compact
+                )
+                for path in paths
+            },
+            cache,
+        )
+
+    def word_lists(self) -> dict[str, int]:
+        """Word count of each word list, by name."""
+        return {name: each.word_count for name, each in self.dictionaries.items()}
+
+    def solve(self, request: Any) -> dict[str, Any]:
+        """Solve a request, see the module docstring for what's in it."""
+        if not isinstance(request, dict) or not isinstance(
+            letters := request.get("letters"), str
+        ):
+            raise ValueError(BAD_REQUEST)
+
+        name = request.get("word_list", next(iter(self.dictionaries)))
+        if not isinstance(name, str):
+            raise ValueError(BAD_WORD_LIST)
+        if name not in self.dictionaries:
+            raise ValueError(NO_SUCH_WORD_LIST)
+        options = search_options(request.get("options", {}))
+        count_only = bool(request.get("count_only", False))
+
+        start = time.perf_counter()
+        solver = Solver(
+            Puzzle(letters),
+            self.dictionaries[name],
+            count_only=count_only,
+            strategy=Strategy(request.get("strategy", Strategy.AUTO)),
+            options=options,
+            cache=self.cache,
+        )
+        seconds = time.perf_counter() - start
+
+        return {"word_list": name} | solution_record(
+            letters,
+            solver,
+            seconds,
+            count_only=count_only,
+            paths=bool(request.get("paths", False)),
+        )
+
+
+def search_options(options: Any) -> SearchOptions:
+    """SearchOptions from a request's options, checking each is the right type.
+
+    Raises ValueError for anything else, rather than letting the search trip
+    over it later.
+    """
+    if not isinstance(options, dict) or not set(options) <= set(OPTION_TYPES):
+        raise ValueError(BAD_OPTIONS)
+    for name, value in options.items():
+        described, types = OPTION_TYPES[name]
+        # bool is an int too, but true isn't a number of words
+        if not isinstance(value, types) or (
+            isinstance(value, bool) and bool not in types
+        ):
+            raise ValueError(BAD_OPTION_TYPE.format(name, described))
+    return SearchOptions(**options)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Turn HTTP requests into SolveService calls."""
+
+    def __init__(self, *args: Any, service: SolveService, **kwargs: Any) -> None:
+        self.service = service
+        # handles the request, so the service has to be set first
+        super().__init__(*args, **kwargs)
+
+    def do_GET(self) -> None:  # noqa: N802
+        """List the word lists, or show the cache's hits and misses."""
+        if self.path == "/word-lists":
+            self._reply(HTTPStatus.OK, self.service.word_lists())
+        elif self.path == "/cache":
+            cache = self.service.cache
+            self._reply(HTTPStatus.OK, cache.stats() if cache else {})
+        else:
+            self._reply(HTTPStatus.NOT_FOUND, {"error": NO_SUCH_PATH})
+
+    def do_POST(self) -> None:  # noqa: N802
+        """Solve a puzzle."""
+        if self.path != "/solve":
+            self._reply(HTTPStatus.NOT_FOUND, {"error": NO_SUCH_PATH})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._reply(HTTPStatus.BAD_REQUEST, {"error": BAD_LENGTH})
+            return
+        if length > MAX_REQUEST_BYTES:
+            self._reply(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": TOO_BIG})
+            return
+        try:
+            result = self.service.solve(json.loads(self.rfile.read(length)))
+        except ValueError as error:
+            # includes bad JSON, letters, options and strategies
+            self._reply(HTTPStatus.BAD_REQUEST, {"error": str(error)})
+            return
+        self._reply(HTTPStatus.OK, result)
+
+    def _reply(self, status: HTTPStatus, body: Any) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def address_string(self) -> str:
+        """Unix socket clients don't have an address."""
+        if isinstance(self.client_address, tuple):
+            return str(self.client_address[0])
+        return "unix"
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """ThreadingHTTPServer, but on a Unix socket."""
+
+    daemon_threads = True
+
+
+def make_server(service: SolveService, address: str) -> socketserver.BaseServer:
+    """A server for service, not yet serving.
+
+    address is a port on localhost (0 for any free one), or else the path of
+    a Unix socket, which is replaced if it's already there.
+    """
+    handler = partial(_Handler, service=service)
+    if address.isdigit():
+        return ThreadingHTTPServer((LOCALHOST, int(address)), handler)
+
+    Path(address).unlink(missing_ok=True)
+    return _UnixHTTPServer(address, handler)
+
+
+def serve(service: SolveService, address: str) -> None:
+    """Answer requests until interrupted."""
+    with make_server(service, address) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if not address.isdigit():
+                Path(address).unlink(missing_ok=True)
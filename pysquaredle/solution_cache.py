@@ -0,0 +1,176 @@
+"""Remember solved puzzles, so solving one again is a lookup.
+
+The same daily puzzle gets solved again and again. A SolutionCache keeps
+recent Solutions in memory, evicting the least recently used, and can also
+pickle them to a directory so they last between runs.
+
+Solutions are keyed by the puzzle's letters, the dictionary's fingerprint
+and whatever in the search changes the answer: the SearchOptions (but not
+the time budget) and whether paths were only counted. The strategy and
+number of workers don't change the answer, so aren't part of the key.
+
+A grid turned or flipped has the same words, with paths through the
+matching cells, so solutions are kept for the puzzle's canonical form and
+moved onto whichever way round it was asked for, then put back in the order
+a search of that grid finds them. Only searches that find every path are
+shared like that: one stopped early by max_words, or after the first path
+of each word, stops somewhere that depends on which way round the grid is,
+and counted words have no paths to put them back in order by.
+
+Classes
+    SolutionCache
+
+Functions
+    solution_key
+"""
+
+# self-referential SolutionCache return type
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from pysquaredle.dictionary import Dictionary
+from pysquaredle.puzzle import Puzzle
+from pysquaredle.solutions import Solutions
+from pysquaredle.word_list import cache_dir, read_pickle, write_pickle
+
+# the version of pickled Solutions, for read_pickle to check
+CACHE_FORMAT = 3
+
+# how many Solutions to keep in memory
+DEFAULT_ENTRIES = 256
+
+
+def solution_key(
+    dictionary: Dictionary,
+    puzzle: Puzzle,
+    *,
+    first_path_only: bool = False,
+    max_words: int | None = None,
+    min_length: int = 1,
+    count_only: bool = False,
+) -> str:
+    """A hash of everything that decides the solutions."""
+    if not (first_path_only or count_only) and max_words is None:
+        puzzle = puzzle.canonical()
+    parts = (
+        puzzle.letters,
+        dictionary.fingerprint,
+        first_path_only,
+        max_words,
+        min_length,
+        count_only,
+    )
+    return hashlib.sha256(repr(parts).encode()).hexdigest()
+
+
+class SolutionCache:
+    """Recently solved puzzles in memory, and optionally on disk.
+
+    Safe to share between threads. What get returns is shared with the
+    cache and anyone else who got it, so shouldn't be changed.
+
+    Attributes:
+        hits    lookups that found solutions, in memory or on disk
+        misses  lookups that didn't
+    """
+
+    def __init__(
+        self, entries: int = DEFAULT_ENTRIES, directory: str | Path | None = None
+    ) -> None:
+        """An empty cache.
+
+        Args:
+            entries: int        how many solutions to keep in memory
+            directory: Path     where to keep them on disk, if at all
+        """
+        self._entries = entries
+        self._directory = Path(directory) if directory is not None else None
+        self._memory: OrderedDict[str, Solutions] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def on_disk(cls, entries: int = DEFAULT_ENTRIES) -> SolutionCache:
+        """A cache that also keeps solutions with the word list cache."""
+        return cls(entries, cache_dir() / "solutions")
+
+    def get(self, key: str, puzzle: Puzzle | None = None) -> Solutions | None:
+        """The solutions stored for key, or None.
+
+        Args:
+            key: str            from solution_key
+            puzzle: Puzzle      to have the paths through this puzzle, if the
+                                solutions were put with it
+        """
+        with self._lock:
+            if (solutions := self._memory.get(key)) is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return _from_canonical(solutions, puzzle)
+
+        if (solutions := self._load(key)) is not None:
+            self._remember(key, solutions)
+            with self._lock:
+                self.hits += 1
+            return _from_canonical(solutions, puzzle)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: str, solutions: Solutions, puzzle: Puzzle | None = None) -> None:
+        """Store solutions for key.
+
+        Args:
+            key: str                from solution_key
+            solutions: Solutions    what was found
+            puzzle: Puzzle          what it was found in, so the solutions can
+                                    be shared with its rotations and reflections
+        """
+        solutions = _to_canonical(solutions, puzzle)
+        self._remember(key, solutions)
+        self._save(key, solutions)
+
+    def stats(self) -> dict[str, int]:
+        """Hit and miss counts, and how many solutions are in memory."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._memory)}
+
+    def _remember(self, key: str, solutions: Solutions) -> None:
+        with self._lock:
+            self._memory[key] = solutions
+            self._memory.move_to_end(key)
+            while len(self._memory) > self._entries:
+                self._memory.popitem(last=False)
+
+    def _load(self, key: str) -> Solutions | None:
+        if self._directory is None:
+            return None
+        solutions = read_pickle(self._directory / f"{key}.pickle", CACHE_FORMAT)
+        return solutions if isinstance(solutions, Solutions) else None
+
+    def _save(self, key: str, solutions: Solutions) -> None:
+        if self._directory is not None:
+            write_pickle(self._directory / f"{key}.pickle", CACHE_FORMAT, solutions)
+
+
+def _to_canonical(solutions: Solutions, puzzle: Puzzle | None) -> Solutions:
+    """Move the paths in solutions for puzzle onto its canonical form."""
+    if puzzle is None or not puzzle.canonical_symmetry:
+        return solutions
+    return solutions.permuted(puzzle.cell_map(puzzle.canonical_symmetry))
+
+
+def _from_canonical(solutions: Solutions, puzzle: Puzzle | None) -> Solutions:
+    """Move the paths in solutions for puzzle's canonical form back onto it."""
+    if puzzle is None or not puzzle.canonical_symmetry:
+        return solutions
+    cells = [0] * puzzle.cell_count
+    for cell, moved in enumerate(puzzle.cell_map(puzzle.canonical_symmetry)):
+        cells[moved] = cell
+    return solutions.permuted(cells)
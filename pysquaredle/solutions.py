@@ -1,13 +1,47 @@
 """Solutions class. A list of words and solution paths for those words.
 
-A solution path is the list of indexes in the puzzle grid that make up a word.
+A solution path is the list of indexes in the puzzle grid that make up a word,
+one cell for each letter.
+
+Solutions can also hold just the number of paths for a word, without the
+paths themselves, for when only the statistics matter.
+
+Dense grids can have hundreds of thousands of paths, so rather than a list of
+lists of ints, each word's paths are packed end to end into one array of
+bytes (or of 16 bit numbers, for grids of more than 256 cells). Every path
+for a word is the same length, so no offsets are needed to split them up.
+
+The orderings and groupings asked for after solving (alphabetical, by length,
+by the cells paths start at or go through, and the unacceptable words) are
+indexes built the first time they're needed and kept until a word or path is
+added, so listing words again doesn't mean sorting them again.
 """
 
+# self-referential Solutions return type
+from __future__ import annotations
+
+from array import array
 from collections import defaultdict
-from itertools import groupby
+from collections.abc import Iterable, Sequence
+from functools import cached_property
 from pathlib import Path
 
 UNACCEPTABLE_WORDS = "./unacceptable.txt"
+PATH_LENGTH = "A path has one cell for each letter of its word"
+
+# array typecodes for cells: bytes until a cell doesn't fit, then 16 bits
+NARROW_CELLS = "B"
+WIDE_CELLS = "H"
+
+# the cached_properties that adding a word or path makes out of date
+INDEXES = (
+    "_alphabetical",
+    "_by_length",
+    "_alphabetical_by_length",
+    "_by_start",
+    "_by_cell",
+    "_unacceptable",
+)
 
 
 class Solutions:
@@ -15,21 +49,89 @@ class Solutions:
 
     def __init__(self) -> None:
         """Create empty solution."""
-        self._solutions: dict[str, list[list[int]]] = defaultdict(list[list[int]])
+        # each word's paths, one after another
+        self._solutions: dict[str, array[int]] = {}
+        self._path_counts: dict[str, int] = defaultdict(int)
+        # set when the search stopped early, so there may be more
+        self.truncated = False
+        # set when any of the INDEXES has been built
+        self._indexed = False
         self._unacceptable_words: list[str]
         self.load_unacceptable_words()
 
     def add(self, word: str, path: list[int]) -> None:
         """Add a solution path to the list of solutions."""
-        self._solutions[word].append(path)
+        if len(path) != len(word):
+            raise ValueError(PATH_LENGTH)
+        if self._indexed:
+            self._forget_indexes()
+        cells = self._cells(word)
+        try:
+            cells.extend(path)
+        except OverflowError:
+            # a cell past 255: drop the part of path that went in, and widen
+            kept = cells[: len(cells) - len(cells) % len(word)]
+            cells = self._solutions[word] = array(WIDE_CELLS, kept)
+            cells.extend(path)
+        self._path_counts[word] += 1
+
+    def add_count(self, word: str, count: int) -> None:
+        """Record count more paths for word without storing them."""
+        if self._indexed:
+            self._forget_indexes()
+        # touch the word so it's listed, in the order it was found
+        self._cells(word)
+        self._path_counts[word] += count
+
+    def _cells(self, word: str) -> array[int]:
+        """The packed paths for word, empty if it's new."""
+        if (cells := self._solutions.get(word)) is None:
+            cells = self._solutions[word] = array(NARROW_CELLS)
+        return cells
+
+    def permuted(self, cells: Sequence[int]) -> Solutions:
+        """A copy with each cell in each path replaced by cells[cell].
+
+        Puzzle.cell_map gives the cells that move solutions onto a rotated
+        or reflected puzzle. The copy is in grid order, as a fresh search of
+        that puzzle would find them: each word's paths in order, and words
+        by their first path. Words only counted have no paths to go by, so
+        keep their order, after the rest.
+        """
+        moved = sorted(
+            ([cells[cell] for cell in path], word)
+            for word in self._solutions
+            for path in self.paths(word)
+        )
+        permuted = Solutions()
+        for path, word in moved:
+            permuted.add(word, path)
+        for word in self._solutions:
+            permuted._cells(word)
+        permuted._path_counts.update(self._path_counts)
+        permuted.truncated = self.truncated
+        return permuted
 
     def words(self) -> list[str]:
         """Return a list of unique words in the solutions."""
         return list(self._solutions.keys())
 
     def paths(self, word: str) -> list[list[int]]:
-        """Return a list of paths for a given word."""
-        return self._solutions[word]
+        """Return a list of paths for a given word. Empty if only counted."""
+        packed = self._solutions.get(word, ())
+        length = len(word)
+        return [
+            list(packed[start : start + length])
+            for start in range(0, len(packed), length)
+        ]
+
+    def path_count_for(self, word: str) -> int:
+        """Number of paths for a given word, whether stored or only counted."""
+        return self._path_counts.get(word, 0)
+
+    def stored_path_count_for(self, word: str) -> int:
+        """Number of paths stored for a given word, without unpacking them."""
+        return len(self._solutions.get(word, ())) // (len(word) or 1)
 
     def word_count(self) -> int:
         """Unique words in the solution."""
@@ -37,15 +139,24 @@ class Solutions:
 
     def path_count(self) -> int:
         """Total number of paths in the solutions."""
-        return sum(len(paths) for paths in self._solutions.values())
+        return sum(self._path_counts.values())
+
+    def grouped_by_length(self, *, sort: bool = False) -> dict[int, list[str]]:
+        """Words of each length, shortest first, alphabetical if sort is set."""
+        groups = self._alphabetical_by_length if sort else self._by_length
+        return {length: list(words) for length, words in groups.items()}
+
+    def starting_at(self, cell: int) -> list[str]:
+        """Words with a path starting at cell, in the order they were found."""
+        return list(self._by_start.get(cell, ()))
+
+    def through(self, cell: int) -> list[str]:
+        """Words with a path using cell, in the order they were found."""
+        return list(self._by_cell.get(cell, ()))
 
     def unacceptable_solutions(self) -> list[str]:
         """Return list of unacceptable words found in the puzzle solutions."""
-        return [
-            u
-            for u in self._solutions.keys()  # noqa: SIM118
-            if u in self._unacceptable_words
-        ]
+        return list(self._unacceptable)
 
     def load_unacceptable_words(self) -> None:
         """Read a list of dodgy words to test against the solutions_list."""
@@ -75,16 +186,16 @@ class Solutions:
             str: a formatted list of solutions suitable for printing
 
         """
-        solutions_list = self.raw_solution_words(sort=alpha_sort, length=length_group)
-
         divider = "\n" if single_column else "\t"
 
         if not length_group:
-            return str.join(divider, solutions_list)
+            return str.join(
+                divider, self.raw_solution_words(sort=alpha_sort, length=False)
+            )
 
         formatted = ""
 
-        for key, group in groupby(solutions_list, key=len):
+        for key, group in self.grouped_by_length(sort=alpha_sort).items():
             if headers:
                 formatted += (
                     f"===> {key} letter words\n\n{str.join(divider, group)}\n\n"
@@ -96,9 +207,62 @@ class Solutions:
 
     def raw_solution_words(self, *, sort: bool, length: bool) -> list[str]:
         """Convert solutions set into list, honoring sort flag."""
-        solutions: list[str] = self.words()
-        if sort:
-            solutions.sort()
         if length:
-            solutions.sort(key=len)
-        return solutions
+            return [
+                word
+                for words in self.grouped_by_length(sort=sort).values()
+                for word in words
+            ]
+        return list(self._alphabetical) if sort else self.words()
+
+    def _forget_indexes(self) -> None:
+        for name in INDEXES:
+            self.__dict__.pop(name, None)
+        self._indexed = False
+
+    @cached_property
+    def _alphabetical(self) -> list[str]:
+        self._indexed = True
+        return sorted(self._solutions)
+
+    @cached_property
+    def _by_length(self) -> dict[int, list[str]]:
+        self._indexed = True
+        return _group_by_length(self._solutions)
+
+    @cached_property
+    def _alphabetical_by_length(self) -> dict[int, list[str]]:
+        self._indexed = True
+        return _group_by_length(self._alphabetical)
+
+    @cached_property
+    def _by_start(self) -> dict[int, list[str]]:
+        self._indexed = True
+        starts: dict[int, list[str]] = defaultdict(list)
+        for word, packed in self._solutions.items():
+            for cell in dict.fromkeys(packed[:: len(word)]):
+                starts[cell].append(word)
+        return starts
+
+    @cached_property
+    def _by_cell(self) -> dict[int, list[str]]:
+        self._indexed = True
+        cells: dict[int, list[str]] = defaultdict(list)
+        for word, packed in self._solutions.items():
+            for cell in dict.fromkeys(packed):
+                cells[cell].append(word)
+        return cells
+
+    @cached_property
+    def _unacceptable(self) -> list[str]:
+        self._indexed = True
+        unacceptable = set(self._unacceptable_words)
+        return [word for word in self._solutions if word in unacceptable]
+
+
+def _group_by_length(words: Iterable[str]) -> dict[int, list[str]]:
+    """words split up by length, shortest first, keeping their order."""
+    groups: dict[int, list[str]] = defaultdict(list)
+    for word in words:
+        groups[len(word)].append(word)
+    return {length: groups[length] for length in sorted(groups)}
@@ -1,59 +1,499 @@
-"""Solve a Squardle Puzzle."""
-
-from collections.abc import Callable
+"""Solve a Squardle Puzzle.
+
+A Dictionary is loaded once, then each puzzle gets a cheap PuzzleSearch
+against it. Solver ties the two together for a single puzzle, as before.
+"""
+
+import os
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from enum import StrEnum
 from functools import cached_property
-from typing import Optional
-
-import rich.progress
+from typing import Any, Optional
 
+from pysquaredle.dawg import Dawg
+from pysquaredle.dictionary import Dictionary, build_trie
+from pysquaredle.profiling import phase
 from pysquaredle.puzzle import Puzzle
+from pysquaredle.solution_cache import SolutionCache, solution_key
 from pysquaredle.solutions import Solutions
-from pysquaredle.trie import Trie
+from pysquaredle.trie import PrefixStatus, WordGraph
+from pysquaredle.word_list import WordList
+
+ProgressReporter = Callable[[str, list[int], PrefixStatus], None]
+
+COUNT_ONLY_HAS_NO_PATHS = "A count_only Solver has no paths to iterate"
+INCOMPLETE_SOLUTIONS = "Only complete solutions, with every path, can be updated"
+
+# words per cell below which tracing each word beats searching the grid, see
+# benchmarks/strategies.py: word-first wins below about 80, grid-first above
+# about 280, and in between it's close and goes either way
+WORD_FIRST_WORDS_PER_CELL = 200
+
+# how many search steps between looks at the clock when there's a time budget
+DEADLINE_CHECK_STEPS = 1024
+
+
+class Strategy(StrEnum):
+    """How to go about finding the words."""
+
+    AUTO = "auto"
+    GRID = "grid"  # walk out from every cell, following the trie
+    WORD = "word"  # try to trace each candidate word on the grid
+
+
+class Deadline:
+    """A time to give up searching, remembering whether anything did."""
+
+    def __init__(self, seconds: float) -> None:
+        """Give up seconds from now."""
+        self.at = time.monotonic() + seconds
+        self.reached = False
+
+    def expired(self) -> bool:
+        """Is it time to stop? Once it says yes, `reached` is set."""
+        if not self.reached and time.monotonic() > self.at:
+            self.reached = True
+        return self.reached
+
+
+@dataclass(frozen=True)
+class SearchOptions:
+    """Limits on a search, for when the full set of solutions isn't needed.
+
+    Attributes:
+        first_path_only: bool   record one path per word, not all of them
+        max_words: int | None   stop once this many different words are found
+        min_length: int         ignore words shorter than this
+        time_budget: float | None   give up this many seconds after the
+                                    search starts
+    """
+
+    first_path_only: bool = False
+    max_words: int | None = None
+    min_length: int = 1
+    time_budget: float | None = None
+
+
+class PuzzleSearch:
+    """One puzzle against a Dictionary: pick a strategy and find the words.
+
+    Cheap to create. The per-puzzle work is filtering the dictionary down to
+    candidate words, and building a trie of them if the grid is searched.
+
+    There are two ways to search. Grid-first walks out from each cell
+    following the trie. Word-first takes each candidate word in turn and
+    tries to trace it on the grid, which needs no trie at all and wins when
+    there are few candidates for the size of grid. Strategy.AUTO picks one.
+    Both give the same solutions in the same order, but word-first only hands
+    them out once it has them all, so AUTO searches the grid when streaming
+    or stopping at max_words.
+
+    Each start cell's grid-first search is independent, so with workers > 1
+    they are farmed out to a pool of processes and the results merged back
+    in grid order.
+
+    SearchOptions can cut the search short. If they do, `truncated` is set
+    once iteration ends and the solutions found are only some of them.
+    """
+
+    def __init__(
+        self,
+        dictionary: Dictionary,
+        puzzle: Puzzle,
+        *,
+        strategy: Strategy = Strategy.AUTO,
+        workers: int = 1,
+        report: Optional[ProgressReporter] = None,  # noqa: UP007
+        options: Optional[SearchOptions] = None,  # noqa: UP007
+        streaming: bool = False,
+    ) -> None:
+        """Prepare to search puzzle.
+
+        Args:
+            dictionary: Dictionary  the words to look for
+            puzzle: Puzzle          the Squaredle puzzle to solve
+            strategy: Strategy      grid-first, word-first or pick for me
+            workers: int            processes to solve with, 0 for one per CPU
+            report: fn              callback to show progress (grid-first,
+                                    single process only)
+            options: SearchOptions  limits on the search, none by default
+            streaming: bool         solutions are wanted as they're found
+        """
+        self.dictionary = dictionary
+        self.puzzle = puzzle
+        self._workers = workers or os.cpu_count() or 1
+        self._report = report
+        self._streaming = streaming
+        self.options = options or SearchOptions()
+        self.truncated = False
+        self._neighbours = [
+            puzzle.neighbours_of(cell) for cell in range(puzzle.cell_count)
+        ]
+
+        with phase("filter"):
+            self.candidates = dictionary.candidates(puzzle)
+            if self.candidates is not None and self.options.min_length > 1:
+                self.candidates = [
+                    word
+                    for word in self.candidates
+                    if len(word) >= self.options.min_length
+                ]
+        self.strategy = self._choose_strategy(strategy)
+
+    @property
+    def word_count(self) -> int:
+        """How many words might be found: candidates, or the whole DAWG."""
+        if self.candidates is None:
+            return self.dictionary.word_count
+        return len(self.candidates)
+
+    @cached_property
+    def graph(self) -> WordGraph[Any]:
+        """The word graph, only built if the grid-first search needs it."""
+        with phase("trie"):
+            return self.dictionary.graph(self.candidates)
+
+    def __iter__(self) -> Iterator[tuple[str, list[int]]]:
+        """Yield (word, path) for every solution, in grid order."""
+        options = self.options
+        deadline = self._deadline()
+        self.truncated = False
+
+        words: set[str] = set()
+        with phase("search"):
+            for word, path in self._find(deadline):
+                if len(word) < options.min_length:
+                    continue
+                if word not in words:
+                    if (
+                        options.max_words is not None
+                        and len(words) >= options.max_words
+                    ):
+                        self.truncated = True
+                        return
+                    words.add(word)
+                elif options.first_path_only:
+                    continue
+                yield word, path
+
+        # the finders give up quietly once the time is up
+        self.truncated = deadline is not None and deadline.reached
+
+    def counts(self) -> dict[str, int]:
+        """The number of paths for each word. Always grid-first, one process.
+
+        first_path_only counts each word once, max_words keeps the first
+        words in grid order.
+        """
+        options = self.options
+        deadline = self._deadline()
+        graph = self.graph
+        with phase("search"):
+            counts = count_paths(graph, self.puzzle.letters, self._neighbours, deadline)
+        self.truncated = deadline is not None and deadline.reached
+
+        found = {
+            word: 1 if options.first_path_only else count
+            for word, count in counts.items()
+            if len(word) >= options.min_length
+        }
+        if options.max_words is not None and len(found) > options.max_words:
+            self.truncated = True
+            found = dict(list(found.items())[: options.max_words])
+        return found
+
+    def _deadline(self) -> Deadline | None:
+        budget = self.options.time_budget
+        return None if budget is None else Deadline(budget)
+
+    def _find(self, deadline: Deadline | None) -> Iterator[tuple[str, list[int]]]:
+        if self.strategy is Strategy.WORD and self.candidates is not None:
+            return trace_words(
+                self.candidates, self.puzzle.letters, self._neighbours, deadline
+            )
+        if self._workers > 1:
+            return self._search_in_parallel(deadline)
+        return self._search(deadline)
+
+    def _choose_strategy(self, strategy: Strategy) -> Strategy:
+        # word-first needs the candidate words
+        if self.candidates is None:
+            return Strategy.GRID
+        if strategy is not Strategy.AUTO:
+            return strategy
+        # progress reports and extra processes are grid-first features
+        if self._report or self._workers > 1:
+            return Strategy.GRID
+        # word-first puts its hits in grid order before handing any out, so
+        # nothing streams and stopping at max_words saves no work
+        if self._streaming or self.options.max_words is not None:
+            return Strategy.GRID
+        words_per_cell = len(self.candidates) / self.puzzle.cell_count
+        if words_per_cell < WORD_FIRST_WORDS_PER_CELL:
+            return Strategy.WORD
+        return Strategy.GRID
+
+    def _search(self, deadline: Deadline | None) -> Iterator[tuple[str, list[int]]]:
+        for start in range(self.puzzle.cell_count):
+            yield from search_from(
+                self.graph,
+                self.puzzle.letters,
+                self._neighbours,
+                start,
+                self._report,
+                deadline,
+            )
+
+    def _search_in_parallel(
+        self, deadline: Deadline | None
+    ) -> Iterator[tuple[str, list[int]]]:
+        """Fan the start cells out to a process pool, one cell per task."""
+        dawg = self.dictionary.dawg
+        # what a worker needs to build the word graph for itself
+        source = str(dawg.path) if dawg else self.candidates or []
+        with ProcessPoolExecutor(
+            max_workers=self._workers,
+            initializer=_start_worker,
+            initargs=(self.puzzle.letters, source, self.dictionary.compact, deadline),
+        ) as pool:
+            # map keeps start cell order, so the results match a serial solve
+            cells = range(self.puzzle.cell_count)
+            for found, gave_up in pool.map(_solve_from_cell, cells):
+                if deadline and gave_up:
+                    # each worker has its own copy of the deadline
+                    deadline.reached = True
+                yield from found
+
+
+def solve(
+    dictionary: Dictionary,
+    puzzle: Puzzle,
+    *,
+    strategy: Strategy = Strategy.AUTO,
+    workers: int = 1,
+    count_only: bool = False,
+    options: Optional[SearchOptions] = None,  # noqa: UP007
+    cache: Optional[SolutionCache] = None,  # noqa: UP007
+) -> Solutions:
+    """Solve puzzle against an already loaded dictionary.
+
+    With a cache, the solutions are looked for there first, and kept there
+    if they have to be found.
+    """
+    options = options or SearchOptions()
+    key = cache_key(dictionary, puzzle, options, count_only=count_only) if cache else ""
+    if cache and (cached := cache.get(key, puzzle)) is not None:
+        return cached
+
+    search = PuzzleSearch(
+        dictionary, puzzle, strategy=strategy, workers=workers, options=options
+    )
+    solutions = Solutions()
+    if count_only:
+        for word, count in search.counts().items():
+            solutions.add_count(word, count)
+    else:
+        for word, path in search:
+            solutions.add(word, path)
+    solutions.truncated = search.truncated
+    if cache and worth_caching(solutions, options):
+        cache.put(key, solutions, puzzle)
+    return solutions
+
+
+def cache_key(
+    dictionary: Dictionary,
+    puzzle: Puzzle,
+    options: SearchOptions,
+    *,
+    count_only: bool = False,
+) -> str:
+    """The SolutionCache key for solving puzzle with options."""
+    return solution_key(
+        dictionary,
+        puzzle,
+        first_path_only=options.first_path_only,
+        max_words=options.max_words,
+        min_length=options.min_length,
+        count_only=count_only,
+    )
+
+
+def worth_caching(solutions: Solutions, options: SearchOptions) -> bool:
+    """Whether solutions would be the same next time.
+
+    Running out of time could stop anywhere, so those aren't.
+    """
+    return not (solutions.truncated and options.time_budget is not None)
+
+
+def resolve_cell(
+    dictionary: Dictionary,
+    puzzle: Puzzle,
+    solutions: Solutions,
+    cell: int,
+    letter: str,
+) -> tuple[Puzzle, Solutions]:
+    """Solve puzzle again after changing the letter in one cell.
+
+    Only paths through cell can be different, so the rest of solutions are
+    kept and just the candidate words with the new letter are traced,
+    outwards from cell. The result is the same as solving the changed puzzle
+    from scratch, in the same order.
+
+    solutions must be from a full solve of puzzle: no count_only and no
+    SearchOptions limits. A DAWG can't be searched from the middle of a word,
+    so with one the changed puzzle is simply solved again.
+
+    Returns the changed puzzle and its solutions.
+    """
+    words = solutions.words()
+    if solutions.truncated or any(
+        solutions.stored_path_count_for(word) != solutions.path_count_for(word)
+        for word in words
+    ):
+        raise ValueError(INCOMPLETE_SOLUTIONS)
+
+    changed = puzzle.with_letter(cell, letter)
+    candidates = dictionary.candidates(changed, through=cell)
+    if candidates is None:
+        return changed, solve(dictionary, changed)
+
+    neighbours = [changed.neighbours_of(each) for each in range(changed.cell_count)]
+    found = [
+        (path, word)
+        for word in words
+        for path in solutions.paths(word)
+        if cell not in path
+    ]
+    found.extend(
+        (path, word)
+        for word, path in trace_through(candidates, changed.letters, neighbours, cell)
+    )
+    # a full solve's paths come out in list order, see trace_words
+    found.sort(key=lambda hit: hit[0])
+
+    resolved = Solutions()
+    for path, word in found:
+        resolved.add(word, path)
+    return changed, resolved
 
 
 class Solver:
     """Solve a Squaredle Puzzle.
 
-    We maintain a word list stored as a trie for speedy starts with searches.
-    We use a recursive chain builder to find solutions in the grid.
+    A thin wrapper round a Dictionary and a PuzzleSearch for when there's
+    only one puzzle. The word list is loaded, filtered down to words that
+    could fit, and searched (see PuzzleSearch for how).
+
+    A compiled dictionary (see `pysquaredle.dawg`) can be given in place of a
+    word list, in which case it is memory-mapped and searched as-is. So can a
+    Dictionary that's already loaded, to share it between puzzles.
+
+    Solving happens on creation unless lazy is set, in which case
+    `iter_solutions` hands out words as they're found.
+
+    Given a SolutionCache, solutions are looked for there before searching,
+    and kept there after.
+
+    With count_only set, paths aren't enumerated at all. Instead the number of
+    paths spelling each word is counted, sharing work between paths that
+    reach the same cell with the same letters and the same cells used.
     """
 
-    # process the word_list.txt using the following command:
-    # gsed -e 's/^\(.*\)\s*$/\U\1/g' raw_word_list.txt > word_list.txt
-    # in other words, uppercase, no trailing whitespace
-    # "gsed" is GNU sed or similar (MacOS sed is BSD sed)
-    # an extra line of comments
+    # word lists no longer need pre-processing with sed: WordList upper-cases,
+    # strips and de-duplicates them, then caches the result (see word_list.py)
 
     def __init__(
         self,
         puzzle: Puzzle,
-        word_list_path: str,
-        update_func: Optional[  # noqa: UP007
-            Callable[[str, list[int], int], None]
-        ] = None,
+        word_list_path: str | WordList | Dictionary,
+        update_func: Optional[ProgressReporter] = None,  # noqa: UP007
+        *,
+        compact: bool = False,
+        use_cache: bool = True,
+        workers: int = 1,
+        lazy: bool = False,
+        count_only: bool = False,
+        strategy: Strategy = Strategy.AUTO,
+        options: Optional[SearchOptions] = None,  # noqa: UP007
+        cache: Optional[SolutionCache] = None,  # noqa: UP007
     ) -> None:
         """Create a Solver for Puzzle.
 
         Args:
             puzzle: Puzzle          the Squaredle puzzle to solve
-            word_list_path: str     a list of acceptable words
-            update_func: fn         callback to show progress
+            word_list_path: str     a list of acceptable words, or a .dawg file,
+                                    or a WordList or Dictionary already loaded
+            update_func: fn         callback to show progress (single process only)
+            compact: bool           store the word list in a CompactTrie
+            use_cache: bool         reuse the preprocessed word list cache
+            workers: int            processes to solve with, 0 for one per CPU
+            lazy: bool              don't solve until asked to, and then
+                                    search in a way that hands out words
+                                    as they're found
+            count_only: bool        count paths rather than record them
+            strategy: Strategy      grid-first, word-first or pick for me
+            options: SearchOptions  limits on the search, none by default
+            cache: SolutionCache    look for the solutions here first
         """
-        # this can do "something" whilst the solutions are generated
-        self._progress_reporter = update_func
+        self._count_only = count_only
 
         self._puzzle = puzzle
-        self._word_trie: Trie = Trie()
         self._solutions: Solutions = Solutions()
-
-        self.word_list_count = 0
-
-        self._load_words(word_list_path)
+        self._solved = False
+
+        if isinstance(word_list_path, Dictionary):
+            dictionary = word_list_path
+        elif isinstance(word_list_path, WordList):
+            dictionary = Dictionary(word_list_path, compact=compact)
+        else:
+            dictionary = Dictionary.load(
+                word_list_path, use_cache=use_cache, compact=compact
+            )
+
+        self._dictionary = dictionary
+        self._update_func = update_func
+        self._workers = workers
+        self._strategy = strategy
+        self._options = options or SearchOptions()
+        self._cache = cache
+        self._cache_checked = False
+        self._lazy = lazy
 
         # now for the good stuff
-        self.solve()
+        if not lazy:
+            self.solve()
 
     @cached_property
+    def _search(self) -> PuzzleSearch:
+        """The search, only set up if the solutions aren't in the cache."""
+        # this can do "something" whilst the solutions are generated
+        return PuzzleSearch(
+            self._dictionary,
+            self._puzzle,
+            strategy=self._strategy,
+            workers=self._workers,
+            report=self._update_func,
+            options=self._options,
+            streaming=self._lazy,
+        )
+
+    @property
+    def word_list_count(self) -> int:
+        """How many words might be in the puzzle."""
+        return self._search.word_count
+
+    @property
+    def strategy(self) -> Strategy:
+        """The strategy actually used. Counting is always grid-first."""
+        return Strategy.GRID if self._count_only else self._search.strategy
+
+    @property
     def solutions(self) -> Solutions:
         """Get our solutions."""
         return self._solutions
@@ -64,9 +504,73 @@ class Solver:
 
     def solve(self) -> None:
         """Solve a puzzle. Builds the `solutions` list."""
-        for index, letter in enumerate(self._puzzle.letters):
-            chain = [index]
-            self._attempt(chain, letter)
+        if self._from_cache():
+            return
+        if self._count_only:
+            self._count()
+            return
+
+        for _ in self.iter_solutions():
+            pass
+
+    def iter_solutions(self) -> Iterator[tuple[str, list[int]]]:
+        """Yield (word, path) for each solution as soon as it is found.
+
+        Solutions are added to `solutions` along the way. Once a solve has
+        run to completion, later calls replay the stored solutions rather
+        than searching again. Abandoning a solve part way leaves `solutions`
+        partial, and the next call starts afresh.
+        """
+        if self._count_only:
+            raise ValueError(COUNT_ONLY_HAS_NO_PATHS)
+
+        if self._solved or self._from_cache():
+            for word in self._solutions.words():
+                for path in self._solutions.paths(word):
+                    yield word, path
+            return
+
+        self._solutions = Solutions()
+        for word, path in self._search:
+            self._solutions.add(word, path)
+            yield word, path
+        self._solutions.truncated = self._search.truncated
+        self._solved = True
+        self._to_cache()
+
+    def _count(self) -> None:
+        """Fill solutions with path counts only."""
+        self._solutions = Solutions()
+        for word, count in self._search.counts().items():
+            self._solutions.add_count(word, count)
+        self._solutions.truncated = self._search.truncated
+        self._solved = True
+        self._to_cache()
+
+    @cached_property
+    def _cache_key(self) -> str:
+        return cache_key(
+            self._dictionary,
+            self._puzzle,
+            self._options,
+            count_only=self._count_only,
+        )
+
+    def _from_cache(self) -> bool:
+        """Use the cached solutions if there are any. Only looks once."""
+        if self._cache is None or self._solved or self._cache_checked:
+            return False
+        self._cache_checked = True
+        if (cached := self._cache.get(self._cache_key, self._puzzle)) is None:
+            return False
+        self._solutions = cached
+        self._solved = True
+        return True
+
+    def _to_cache(self) -> None:
+        """Keep the solutions for next time, if they'd be the same."""
+        if self._cache and worth_caching(self._solutions, self._options):
+            self._cache.put(self._cache_key, self._solutions, self._puzzle)
 
     def formatted_solutions(
         self,
@@ -90,55 +594,6 @@ class Solver:
         """Pass the raw solution words from our solutions object."""
         return self._solutions.raw_solution_words(sort=sort, length=length)
 
-    def _attempt(self, index_chain: list[int], word: str) -> None:
-        """The recursive word finder.
-
-        Builds chains of letters by iterating through cell neighbours.
-        Adds new found words to the solutions set, ignoring duplicates.
-        """
-        hits: list[str] = self._word_trie.search(word)
-
-        if self._progress_reporter:
-            self._progress_reporter(word, index_chain, len(hits))
-
-        if not hits:
-            return
-
-        if hits[0] == word:
-            self._solutions.add(word, index_chain)
-
-        for neighbour in self._puzzle.neighbours_of(index_chain[-1]):
-            if neighbour not in index_chain:
-                self._attempt(
-                    [*index_chain, neighbour],
-                    "".join([word, self._puzzle.letters[neighbour]]),
-                )
-
-    def _load_words(self, word_list_path: str) -> None:
-        # this is a known issue with Python up to version 3.15 (in the future!)
-        # pylint: disable=unspecified-encoding
-        with rich.progress.open(word_list_path, "r") as words_file:
-            for word in [
-                w for w in words_file.read().splitlines() if self.interesting_word(w)
-            ]:
-                self.word_list_count += 1
-                self._word_trie.insert(word)
-        # pylint: enable=unspecified-encoding
-
-    def interesting_word(self, word: str) -> bool:
-        """Check if a word is interesting.
-
-        skip lines that are too long
-        skip lines that don't start with a  letter from our puzzle
-        skip lines with letters not in our puzzle.
-        """
-        candidate_letters = self._puzzle.unique_letters
-        return (
-            len(word) <= self._puzzle.cell_count
-            and word[0] in candidate_letters
-            and word_only_contains_puzzle_letters(word, candidate_letters)
-        )
-
     def word_count(self) -> int:
         """Pass the word count from our solutions object."""
 
@@ -149,6 +604,297 @@ class Solver:
         return self._solutions.path_count()
 
 
-def word_only_contains_puzzle_letters(word: str, letters: str) -> bool:
-    """Check if a word contains only letters from a given set."""
-    return not any(letter not in letters for letter in word)
+def search_from(
+    graph: WordGraph[Any],
+    letters: str,
+    neighbours: list[list[int]],
+    start: int,
+    report: Optional[ProgressReporter] = None,  # noqa: UP007
+    deadline: Deadline | None = None,
+) -> Iterator[tuple[str, list[int]]]:
+    """The depth-first word finder, starting from one cell.
+
+    Builds chains of letters by iterating through cell neighbours and yields
+    (word, path) for every word spelled along the way.
+
+    Iterative rather than recursive: a stack holding an iterator over the
+    untried neighbours of each cell on the path, one path buffer that grows
+    and shrinks with it, and a bitmask of visited cells. Words and path copies
+    are only made when we hit a word.
+
+    Stops early if deadline expires, which the deadline remembers.
+    """
+    child_of = graph.child
+    status_of = graph.node_status
+
+    node = child_of(graph.root, letters[start])
+    if node is None:
+        return
+
+    path = [start]
+    visited = 1 << start
+
+    status = status_of(node)
+    if report:
+        report(letters[start], path.copy(), status)
+    if status & PrefixStatus.WORD:
+        yield letters[start], path.copy()
+    if not status & PrefixStatus.PREFIX:
+        return
+
+    nodes = [node]
+    untried = [iter(neighbours[start])]
+    steps = DEADLINE_CHECK_STEPS
+    while untried:
+        if deadline is not None:
+            steps -= 1
+            if not steps:
+                if deadline.expired():
+                    return
+                steps = DEADLINE_CHECK_STEPS
+
+        for cell in untried[-1]:
+            if visited >> cell & 1:
+                continue
+            child = child_of(nodes[-1], letters[cell])
+            if child is None:
+                continue
+
+            path.append(cell)
+            status = status_of(child)
+            if report:
+                report("".join([letters[i] for i in path]), path.copy(), status)
+            if status & PrefixStatus.WORD:
+                yield "".join([letters[i] for i in path]), path.copy()
+
+            if status & PrefixStatus.PREFIX:
+                # down a level, the rest of this cell's neighbours can wait
+                visited |= 1 << cell
+                nodes.append(child)
+                untried.append(iter(neighbours[cell]))
+                break
+
+            path.pop()
+        else:
+            # tried every neighbour, back up a cell
+            untried.pop()
+            nodes.pop()
+            visited ^= 1 << path.pop()
+
+
+def trace_words(
+    words: list[str],
+    letters: str,
+    neighbours: list[list[int]],
+    deadline: Deadline | None = None,
+) -> Iterator[tuple[str, list[int]]]:
+    """The word-first finder: trace each word on the grid, no trie required.
+
+    For each cell we index its neighbours by letter, so extending a partial
+    path only looks at cells with the right letter. Every path for every word
+    is found, then they're sorted so that they come out in exactly the order
+    the grid-first search would produce them: that search tries start cells
+    and neighbours in index order, so its paths come out in list order.
+
+    Past deadline, no more words are traced and whatever was found so far
+    comes out.
+    """
+    cells_with: dict[str, list[int]] = defaultdict(list)
+    for cell, letter in enumerate(letters):
+        cells_with[letter].append(cell)
+
+    next_cells = _neighbours_by_letter(letters, neighbours)
+    found: list[tuple[list[int], str]] = []
+
+    def extend(word: str, path: list[int], visited: int) -> None:
+        depth = len(path)
+        if depth == len(word):
+            found.append((path.copy(), word))
+            return
+        for cell in next_cells[path[-1]].get(word[depth], ()):
+            if not visited >> cell & 1:
+                path.append(cell)
+                extend(word, path, visited | 1 << cell)
+                path.pop()
+
+    for number, word in enumerate(words):
+        if deadline and not number % DEADLINE_CHECK_STEPS and deadline.expired():
+            break
+        for start in cells_with.get(word[0], ()):
+            extend(word, [start], 1 << start)
+
+    found.sort(key=lambda hit: hit[0])
+    for path, word in found:
+        yield word, path
+
+
+def trace_through(
+    words: list[str], letters: str, neighbours: list[list[int]], cell: int
+) -> Iterator[tuple[str, list[int]]]:
+    """Every path spelling one of words that passes through cell, unordered.
+
+    Rather than starting at the first letter, each word is anchored at cell
+    wherever its letter appears in the word. Tracing goes forwards from there
+    for the rest of the word, then backwards for the start of it, so only
+    paths through cell are ever looked at.
+    """
+    next_cells = _neighbours_by_letter(letters, neighbours)
+    anchor = letters[cell]
+    for word in words:
+        for position, char in enumerate(word):
+            if char != anchor:
+                continue
+            for after in _spell_from(next_cells, word[position + 1 :], cell, 1 << cell):
+                used = 1 << cell
+                for following in after:
+                    used |= 1 << following
+                # neighbours go both ways, so the start is spelled backwards
+                for before in _spell_from(
+                    next_cells, word[position - 1 :: -1] if position else "", cell, used
+                ):
+                    yield word, [*reversed(before), cell, *after]
+
+
+def _neighbours_by_letter(
+    letters: str, neighbours: list[list[int]]
+) -> list[dict[str, list[int]]]:
+    """For each cell, its neighbours grouped by their letter."""
+    next_cells: list[dict[str, list[int]]] = []
+    for cell_neighbours in neighbours:
+        by_letter: dict[str, list[int]] = defaultdict(list)
+        for neighbour in cell_neighbours:
+            by_letter[letters[neighbour]].append(neighbour)
+        next_cells.append(by_letter)
+    return next_cells
+
+
+def _spell_from(
+    next_cells: list[dict[str, list[int]]], rest: str, cell: int, visited: int
+) -> Iterator[list[int]]:
+    """Each list of unvisited cells leading on from cell that spells rest."""
+    if not rest:
+        yield []
+        return
+    for following in next_cells[cell].get(rest[0], ()):
+        if not visited >> following & 1:
+            for more in _spell_from(
+                next_cells, rest[1:], following, visited | 1 << following
+            ):
+                yield [following, *more]
+
+
+class _OutOfTimeError(Exception):
+    """Unwinds count_paths' recursion when the deadline passes."""
+
+
+def count_paths(
+    graph: WordGraph[Any],
+    letters: str,
+    neighbours: list[list[int]],
+    deadline: Deadline | None = None,
+) -> dict[str, int]:
+    """How many distinct paths spell each word, without listing the paths.
+
+    Everything that can follow a partial path depends only on the cell it
+    ends at, the cells it has used and the letters it spells. Paths that
+    agree on all three (common when letters repeat) share one calculation,
+    so the work grows with the number of distinct states rather than the
+    number of paths.
+
+    Words come out in the order a full search would first find them.
+
+    The clock is checked every DEADLINE_CHECK_STEPS states. Past deadline,
+    the counts from the start cells already finished are returned.
+    """
+    memo: dict[tuple[int, int, str], dict[str, int]] = {}
+    child_of = graph.child
+    status_of = graph.node_status
+    steps = DEADLINE_CHECK_STEPS
+
+    def counts(cell: int, visited: int, prefix: str, node: Any) -> dict[str, int]:
+        nonlocal steps
+        status = status_of(node)
+        if not status & PrefixStatus.PREFIX:
+            # a dead end is cheaper to work out again than to remember
+            return {prefix: 1} if status & PrefixStatus.WORD else {}
+
+        key = (cell, visited, prefix)
+        if (known := memo.get(key)) is not None:
+            return known
+
+        if deadline is not None:
+            steps -= 1
+            if not steps:
+                if deadline.expired():
+                    raise _OutOfTimeError
+                steps = DEADLINE_CHECK_STEPS
+
+        found: dict[str, int] = {prefix: 1} if status & PrefixStatus.WORD else {}
+        for neighbour in neighbours[cell]:
+            if visited >> neighbour & 1:
+                continue
+            letter = letters[neighbour]
+            if (child := child_of(node, letter)) is None:
+                continue
+            below = counts(neighbour, visited | 1 << neighbour, prefix + letter, child)
+            for word, count in below.items():
+                found[word] = found.get(word, 0) + count
+
+        memo[key] = found
+        return found
+
+    totals: dict[str, int] = {}
+    for start, letter in enumerate(letters):
+        if deadline and deadline.expired():
+            break
+        if (node := child_of(graph.root, letter)) is None:
+            continue
+        try:
+            found = counts(start, 1 << start, letter, node)
+        except _OutOfTimeError:
+            # this start cell's counts are incomplete, so leave them out
+            break
+        for word, count in found.items():
+            totals[word] = totals.get(word, 0) + count
+        # states from one start cell rarely recur from another, and this keeps
+        # the memo's size down to one start cell's worth
+        memo.clear()
+
+    return totals
+
+
+# each worker process builds its own word graph once, then solves cells
+_worker: dict[str, Any] = {}
+
+
+def _start_worker(
+    letters: str, source: str | list[str], compact: bool, deadline: Deadline | None
+) -> None:
+    """Process pool initializer: build the word graph once per worker.
+
+    source is a .dawg path, or the candidate words to put in a trie.
+    """
+    puzzle = Puzzle(letters)
+    _worker["graph"] = (
+        Dawg(source) if isinstance(source, str) else build_trie(source, compact=compact)
+    )
+    _worker["letters"] = puzzle.letters
+    _worker["deadline"] = deadline
+    _worker["neighbours"] = [
+        puzzle.neighbours_of(cell) for cell in range(puzzle.cell_count)
+    ]
+
+
+def _solve_from_cell(start: int) -> tuple[list[tuple[str, list[int]]], bool]:
+    """Process pool task: every word starting at one cell, and if we gave up."""
+    deadline: Deadline | None = _worker["deadline"]
+    found = list(
+        search_from(
+            _worker["graph"],
+            _worker["letters"],
+            _worker["neighbours"],
+            start,
+            deadline=deadline,
+        )
+    )
+    return found, bool(deadline and deadline.reached)
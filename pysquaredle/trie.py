@@ -1,14 +1,63 @@
 """Trie https://en.wikipedia.org/wiki/Trie.
 
 Classes
+    PrefixStatus
+    WordGraph
     TrieNode
     Trie
+    CompactTrie
 """
 
 # self-referential TrieNode type declaration needs this for 3.10
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Protocol, TypeVar
+
+NodeT = TypeVar("NodeT")
+
+COMPACT_ASCII_ONLY = "CompactTrie words must be ASCII"
+
+
+class PrefixStatus(IntEnum):
+    """What the Trie knows about a string of letters.
+
+    The values are bits, so WORD_AND_PREFIX tests true against both WORD and
+    PREFIX with `&`. An IntEnum rather than an IntFlag because `&` on an
+    IntEnum is plain int arithmetic, and the solver does it at every step.
+    """
+
+    NOT_PREFIX = 0
+    WORD = 1
+    PREFIX = 2
+    WORD_AND_PREFIX = 3
+
+    @staticmethod
+    def of(*, word: bool, prefix: bool) -> PrefixStatus:
+        """The status for a node that does or doesn't end a word or continue."""
+        return _PREFIX_STATUSES[word + 2 * prefix]
+
+
+_PREFIX_STATUSES = tuple(PrefixStatus)
+
+
+class WordGraph(Protocol[NodeT]):
+    """Anything the solver can walk a letter at a time from a root node.
+
+    Node handles are opaque: TrieNode objects for Trie, ints for Dawg.
+    """
+
+    @property
+    def root(self) -> NodeT:
+        """The node for the empty string."""
+
+    def child(self, node: NodeT, char: str) -> NodeT | None:
+        """Step from node down to the child for char, if there is one."""
+
+    def node_status(self, node: NodeT) -> PrefixStatus:
+        """The PrefixStatus of the letters leading to node."""
 
 
 @dataclass
@@ -19,6 +68,11 @@ class TrieNode:
     children: dict[str, TrieNode] = field(default_factory=dict)
     is_end: bool = False
 
+    @property
+    def status(self) -> PrefixStatus:
+        """Is this node the end of a word, the start of longer words, or both."""
+        return _PREFIX_STATUSES[self.is_end + 2 * bool(self.children)]
+
 
 class Trie:
     """A trie structure. Nodes contain a letter and a dictionary of children.
@@ -49,6 +103,31 @@ class Trie:
         # just added a complete word so flag that in the trie
         node.is_end = True
 
+    def child(self, node: TrieNode, char: str) -> TrieNode | None:
+        """Step from node down to the child for char, if there is one.
+
+        Lets a caller hang on to a node as a cursor and extend it a letter at
+        a time rather than re-walking from the root for every prefix.
+        """
+        return node.children.get(char)
+
+    def node_status(self, node: TrieNode) -> PrefixStatus:
+        """The PrefixStatus of the letters leading to node."""
+        return node.status
+
+    def status(self, target: str) -> PrefixStatus:
+        """Is target a word, the start of a word, both or neither.
+
+        Only walks len(target) nodes and builds nothing, so much cheaper than
+        `search` when you don't need the completions themselves.
+        """
+        node = self.root
+        for char in target:
+            if char not in node.children:
+                return PrefixStatus.NOT_PREFIX
+            node = node.children[char]
+        return node.status
+
     def dfs(self, output: list[str], node: TrieNode, pre: str) -> None:
         """Depth-first search of the Trie. Down we go to find the prefix."""
         candidate = pre + node.char
@@ -59,7 +138,11 @@ class Trie:
             self.dfs(output, child, candidate)
 
     def search(self, target: str) -> list[str]:
-        """Attempt to find a prefix string in the Trie."""
+        """Attempt to find a prefix string in the Trie.
+
+        Returns every word starting with target. Use `status` if you only
+        need to know whether there are any.
+        """
         node = self.root
         for char in target:
             if char not in node.children:
@@ -69,3 +152,111 @@ class Trie:
         self.dfs(output, node, target[:-1])
 
         return output
+
+
+class CompactTrie:
+    """A trie held in a handful of flat arrays rather than node objects.
+
+    Nodes are plain ints indexing parallel arrays: the edge label into the
+    node, its first child, its next sibling and whether it ends a word. Index
+    0 is the root, so 0 also means "no child" or "no sibling". Costs around
+    ten bytes a node against several hundred for a TrieNode and its dict,
+    and gives the garbage collector nothing to chase.
+
+    Children are found by walking the sibling chain, which is at most 26 long.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty CompactTrie."""
+        self._labels = array("B", [0])
+        self._first_child = array("I", [0])
+        self._next_sibling = array("I", [0])
+        self._is_end = bytearray(1)
+
+    @property
+    def root(self) -> int:
+        """The node for the empty string."""
+        return 0
+
+    def __len__(self) -> int:
+        """Number of nodes, including the root."""
+        return len(self._labels)
+
+    def insert(self, word: str) -> None:
+        """Add a word to the CompactTrie."""
+        node = 0
+        for char in word:
+            code = ord(char)
+            if code > 0x7F:  # noqa: PLR2004
+                raise ValueError(COMPACT_ASCII_ONLY)
+
+            previous = 0
+            child = self._first_child[node]
+            while child and self._labels[child] != code:
+                previous = child
+                child = self._next_sibling[child]
+
+            if not child:
+                child = len(self._labels)
+                self._labels.append(code)
+                self._first_child.append(0)
+                self._next_sibling.append(0)
+                self._is_end.append(0)
+                if previous:
+                    self._next_sibling[previous] = child
+                else:
+                    self._first_child[node] = child
+
+            node = child
+
+        self._is_end[node] = 1
+
+    def child(self, node: int, char: str) -> int | None:
+        """Step from node down to the child for char, if there is one."""
+        code = ord(char)
+        labels = self._labels
+        next_sibling = self._next_sibling
+        child = self._first_child[node]
+        while child:
+            if labels[child] == code:
+                return child
+            child = next_sibling[child]
+        return None
+
+    def node_status(self, node: int) -> PrefixStatus:
+        """The PrefixStatus of the letters leading to node."""
+        return PrefixStatus.of(
+            word=bool(self._is_end[node]), prefix=bool(self._first_child[node])
+        )
+
+    def status(self, target: str) -> PrefixStatus:
+        """Is target a word, the start of a word, both or neither."""
+        node: int | None = 0
+        for char in target:
+            if node is None:
+                break
+            node = self.child(node, char)
+        return PrefixStatus.NOT_PREFIX if node is None else self.node_status(node)
+
+    def search(self, target: str) -> list[str]:
+        """Attempt to find a prefix string in the CompactTrie."""
+        node: int | None = 0
+        for char in target:
+            if node is None:
+                return []
+            node = self.child(node, char)
+        if node is None:
+            return []
+
+        output: list[str] = []
+        self._dfs(output, node, target)
+        return output
+
+    def _dfs(self, output: list[str], node: int, pre: str) -> None:
+        if self._is_end[node]:
+            output.append(pre)
+
+        child = self._first_child[node]
+        while child:
+            self._dfs(output, child, pre + chr(self._labels[child]))
+            child = self._next_sibling[child]
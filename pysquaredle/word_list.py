@@ -0,0 +1,203 @@
+"""Word lists, normalised once and cached between runs.
+
+The raw word list is upper-cased, stripped, de-duplicated and sorted by
+length. The result, along with a letter mask for each word, is pickled into a
+cache directory keyed by a hash of the source file's contents. The next run
+with the same file skips the text processing and just unpickles.
+
+To avoid re-hashing a big file every run, the hash is remembered alongside
+the file's size and modification time and only recalculated if either
+changes.
+
+Classes
+    WordList
+
+Functions
+    letter_mask
+    cache_dir
+    read_pickle
+    write_pickle
+"""
+
+# self-referential WordList return type
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+from bisect import bisect_right
+from itertools import compress
+from pathlib import Path
+from typing import Any
+
+import rich.progress
+
+CACHE_ENV = "PYSQUAREDLE_CACHE_DIR"
+
+# bump this if the pickled layout changes
+CACHE_FORMAT = 2
+
+ALPHABET_SIZE = 26
+
+# anything outside A-Z shares a single bit, so it never matches a puzzle
+OTHER_LETTER = 1 << ALPHABET_SIZE
+
+
+def letter_mask(word: str) -> int:
+    """One bit per distinct letter in word, A is bit 0."""
+    mask = 0
+    for char in word:
+        offset = ord(char) - ord("A")
+        mask |= 1 << offset if 0 <= offset < ALPHABET_SIZE else OTHER_LETTER
+    return mask
+
+
+def cache_dir() -> Path:
+    """Where preprocessed word lists live.
+
+    $PYSQUAREDLE_CACHE_DIR if set, otherwise pysquaredle under the XDG cache
+    directory.
+    """
+    if override := os.environ.get(CACHE_ENV):
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "pysquaredle"
+
+
+def read_pickle(path: Path, version: int) -> Any | None:
+    """What write_pickle left in path.
+
+    None if it's missing, unreadable or written with another version.
+    """
+    try:
+        with path.open("rb") as cached:
+            found, contents = pickle.load(cached)  # noqa: S301
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        return None
+    return contents if found == version else None
+
+
+def write_pickle(path: Path, version: int, contents: Any) -> None:
+    """Pickle contents into path, marked with version.
+
+    A cache we can't write to isn't fatal, so OSErrors are ignored.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # unique to this thread of this process, so writers don't collide
+        partial = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.partial")
+        with partial.open("wb") as cached:
+            pickle.dump((version, contents), cached, protocol=pickle.HIGHEST_PROTOCOL)
+        # atomic, so concurrent runs never see half a file
+        partial.replace(path)
+    except OSError:
+        pass
+
+
+class WordList:
+    """A normalised word list and the letter mask of each word."""
+
+    def __init__(
+        self,
+        words: list[str],
+        masks: list[int] | None = None,
+        digest: str = "",
+    ) -> None:
+        """Wrap words that are already normalised and sorted.
+
+        Args:
+            words: list[str]    upper-case, unique, sorted by length
+            masks: list[int]    letter masks for words, calculated if missing
+            digest: str         hash of the source file, if there was one
+        """
+        self.words = words
+        self.masks = masks if masks is not None else [letter_mask(w) for w in words]
+        self.digest = digest
+
+    def __len__(self) -> int:
+        """Number of words."""
+        return len(self.words)
+
+    def matching(self, letters: str, max_length: int) -> list[str]:
+        """Words no longer than max_length made only from letters.
+
+        The list is sorted by length so the length cut is a binary search, and
+        the letter check is one AND per word against the masks. No per
+        character work at all.
+        """
+        excluded = ~(letter_mask(letters) & ~OTHER_LETTER)
+        end = bisect_right(self.words, max_length, key=len)
+        return list(
+            compress(
+                self.words[:end],
+                [not mask & excluded for mask in self.masks[:end]],
+            )
+        )
+
+    @classmethod
+    def from_lines(cls, lines: list[str], digest: str = "") -> WordList:
+        """Normalise raw lines from a word list file."""
+        words = {line.strip().upper() for line in lines} - {""}
+        return cls(sorted(words, key=lambda word: (len(word), word)), digest=digest)
+
+    @classmethod
+    def load(cls, path: str | Path, *, use_cache: bool = True) -> WordList:
+        """Load a word list file, going via the cache where possible."""
+        path = Path(path)
+        if not use_cache:
+            return cls.from_lines(_read_lines(path))
+
+        cache = cache_dir()
+        digest = _source_digest(path, cache)
+        entry = cache / f"{digest}.pickle"
+
+        if (cached := read_pickle(entry, CACHE_FORMAT)) is not None:
+            words, masks = cached
+            return cls(words, masks, digest)
+
+        word_list = cls.from_lines(_read_lines(path), digest)
+        word_list.save(entry)
+        return word_list
+
+    def save(self, entry: Path) -> None:
+        """Pickle into the cache, see write_pickle."""
+        write_pickle(entry, CACHE_FORMAT, (self.words, self.masks))
+
+
+def _read_lines(path: Path) -> list[str]:
+    # this is a known issue with Python up to version 3.15 (in the future!)
+    # pylint: disable=unspecified-encoding
+    with rich.progress.open(path, "r") as words_file:
+        return words_file.read().splitlines()
+    # pylint: enable=unspecified-encoding
+
+
+def _source_digest(path: Path, cache: Path) -> str:
+    """Content hash of path, trusting a remembered one if size and mtime match."""
+    stat = path.stat()
+    stamp_name = hashlib.sha256(str(path.resolve()).encode()).hexdigest()
+    stamp_path = cache / "stamps" / f"{stamp_name}.json"
+
+    try:
+        stamp = json.loads(stamp_path.read_text(encoding="utf-8"))
+        if stamp["size"] == stat.st_size and stamp["mtime_ns"] == stat.st_mtime_ns:
+            return str(stamp["digest"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+
+    try:
+        stamp_path.parent.mkdir(parents=True, exist_ok=True)
+        stamp_path.write_text(
+            json.dumps(
+                {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digest": digest}
+            ),
+            encoding="utf-8",
+        )
+    except OSError:
+        pass
+
+    return digest
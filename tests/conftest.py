@@ -0,0 +1,25 @@
+"""Shared fixtures: keep the tests' caches out of the user's cache."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from pysquaredle.word_list import CACHE_ENV
+
+
+@pytest.fixture(name="session_cache", scope="session", autouse=True)
+def fixture_session_cache(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """A disposable cache for fixtures loaded once per module."""
+    cache = tmp_path_factory.mktemp("cache")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv(CACHE_ENV, str(cache))
+        yield cache
+
+
+@pytest.fixture(name="cache", autouse=True)
+def fixture_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the word list cache somewhere disposable, fresh for each test."""
+    cache = tmp_path / "cache"
+    monkeypatch.setenv(CACHE_ENV, str(cache))
+    return cache
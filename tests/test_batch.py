@@ -0,0 +1,86 @@
+"""Test batch solving."""
+
+import pytest
+
+from pysquaredle.batch import (
+    NO_LETTERS,
+    BatchStats,
+    parse_puzzle,
+    read_puzzles,
+    solve_batch,
+)
+
+TEST_WORDS = "test_word_list.txt"
+
+
+def test_read_puzzles_takes_letters_and_json() -> None:
+    """Bare letters get their line number, JSON keeps its id, blanks are skipped."""
+    lines = ["ABCDEFGHI\n", "\n", '{"id": "anthro", "letters": "HTEZRONIOPAHMORP"}\n']
+
+    assert [parse_puzzle(*line) for line in read_puzzles(lines)] == [
+        ("1", "ABCDEFGHI"),
+        ("anthro", "HTEZRONIOPAHMORP"),
+    ]
+
+
+def test_read_puzzles_needs_letters() -> None:
+    """A JSON line without letters, or that isn't JSON, is an error."""
+    with pytest.raises(ValueError):
+        parse_puzzle("1", '{"id": 1}')
+    with pytest.raises(ValueError):
+        parse_puzzle("1", '{"letters": ')
+
+
+def test_bad_lines_dont_stop_the_batch() -> None:
+    """Lines that can't be read are failures, and the rest still get solved."""
+    stats = BatchStats()
+    lines = ["ABCDEFGHI", '{"letters": 5}', '{"letters": ', "UCHEMDRIAEHTRCGA"]
+    results = list(solve_batch(read_puzzles(lines), TEST_WORDS, stats))
+
+    assert results[0]["words"] == ["HEAD"]
+    assert results[1] == {"id": "2", "error": NO_LETTERS}
+    assert results[2]["id"] == "3"
+    assert "error" in results[2]
+    assert results[3]["words"] == ["HIRER", "HEAD"]
+    assert (stats.puzzles, stats.failures) == (2, 2)
+
+
+def test_solve_batch() -> None:
+    """Every puzzle gets a result, bad ones an error, and the totals add up."""
+    stats = BatchStats()
+    results = list(
+        solve_batch(
+            [("1", "ABCDEFGHI"), ("2", "HTEZRONIOPAHMORP"), ("3", "ABC1")],
+            TEST_WORDS,
+            stats,
+        )
+    )
+
+    assert results[0]["words"] == ["HEAD"]
+    assert results[1]["words"] == ["ANTHROPOMORPHIZE"]
+    assert "error" in results[2]
+    assert stats.puzzles == 2
+    assert stats.failures == 1
+    assert stats.words == 2
+    assert stats.per_second > 0
+
+
+def test_solve_batch_count_only() -> None:
+    """Counting leaves the word lists out."""
+    stats = BatchStats()
+    (result,) = solve_batch([("1", "ABCDEFGHI")], TEST_WORDS, stats, count_only=True)
+
+    assert result["word_count"] == 1
+    assert result["path_count"] == 1
+    assert "words" not in result
+
+
+def test_solve_batch_compact_and_workers() -> None:
+    """The compact trie and extra processes find the same words."""
+    puzzles = [("1", "ABCDEFGHI"), ("2", "UCHEMDRIAEHTRCGA")]
+    plain = list(solve_batch(puzzles, TEST_WORDS, BatchStats()))
+    tuned = list(
+        solve_batch(puzzles, TEST_WORDS, BatchStats(), compact=True, workers=2)
+    )
+
+    assert [r["words"] for r in tuned] == [r["words"] for r in plain]
@@ -0,0 +1,57 @@
+"""Test the compiled DAWG dictionary."""
+
+from pathlib import Path
+
+import pytest
+
+from pysquaredle.dawg import Dawg, compile_dawg
+from pysquaredle.puzzle import Puzzle
+from pysquaredle.solver import Solver
+from pysquaredle.trie import PrefixStatus
+
+TEST_WORDS = "test_word_list.txt"
+
+
+@pytest.fixture(name="dawg_path")
+def fixture_dawg_path(tmp_path: Path) -> Path:
+    """The test word list compiled to a DAWG."""
+    path = tmp_path / "test_words.dawg"
+    words = Path(TEST_WORDS).read_text(encoding="utf-8").splitlines()
+    compile_dawg(words, path)
+    return path
+
+
+def test_compile_normalises_words(tmp_path: Path) -> None:
+    """Words are upper-cased, stripped and de-duplicated."""
+    path = tmp_path / "small.dawg"
+    assert compile_dawg(["head ", "HEAD", "header", "heat"], path) == 3
+
+    dawg = Dawg(path)
+    assert dawg.word_count == 3
+    assert dawg.status("HEAD") == PrefixStatus.WORD_AND_PREFIX
+    assert dawg.status("HEA") == PrefixStatus.PREFIX
+    assert dawg.status("HEAT") == PrefixStatus.WORD
+    assert dawg.status("HX") == PrefixStatus.NOT_PREFIX
+
+
+def test_every_word_is_found(dawg_path: Path) -> None:
+    """Minimisation mustn't lose or invent words."""
+    dawg = Dawg(dawg_path)
+    for word in Path(TEST_WORDS).read_text(encoding="utf-8").splitlines():
+        assert dawg.status(word) & PrefixStatus.WORD
+
+
+def test_rejects_non_dawg_file() -> None:
+    """A plain word list is not a DAWG."""
+    with pytest.raises(ValueError):
+        Dawg(TEST_WORDS)
+
+
+def test_solver_matches_word_list(dawg_path: Path) -> None:
+    """Solving from the DAWG gives the same results as the word list."""
+    puzzle = Puzzle("HTEZRONIOPAHMORP")
+    from_text = Solver(puzzle, word_list_path=TEST_WORDS)
+    from_dawg = Solver(puzzle, word_list_path=str(dawg_path))
+
+    assert from_dawg.raw_solution_words() == from_text.raw_solution_words()
+    assert from_dawg.path_count() == from_text.path_count()
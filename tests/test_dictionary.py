@@ -0,0 +1,86 @@
+"""Test the Dictionary class."""
+
+from pathlib import Path
+
+import pytest
+
+from pysquaredle.dawg import compile_dawg
+from pysquaredle.dictionary import (
+    Dictionary,
+    bigram_pattern,
+    word_fits_letter_counts,
+    word_only_uses_bigrams,
+)
+from pysquaredle.puzzle import Puzzle
+from pysquaredle.trie import PrefixStatus
+from pysquaredle.word_list import WordList
+
+TEST_WORDS = "test_word_list.txt"
+
+
+@pytest.fixture(name="good_puzzle")
+def fixture_good_puzzle() -> Puzzle:
+    """Just a good puzzle."""
+    return Puzzle("ABCDEFGHI")
+
+
+def test_candidates_are_filtered_per_puzzle(good_puzzle: Puzzle) -> None:
+    """Only words the grid could spell are candidates."""
+    dictionary = Dictionary(WordList.from_lines(["head", "bead", "bail", "zebra"]))
+
+    assert dictionary.word_count == 4
+    assert dictionary.candidates(good_puzzle) == ["BEAD", "HEAD"]
+    assert dictionary.candidates(Puzzle("ZEBRAXXXX")) == []
+
+
+def test_graph_of_candidates(good_puzzle: Puzzle) -> None:
+    """The graph is a trie of the candidates given to it."""
+    dictionary = Dictionary.load(TEST_WORDS, compact=True)
+    graph = dictionary.graph(dictionary.candidates(good_puzzle))
+
+    node = graph.root
+    for char in "HEAD":
+        node = graph.child(node, char)
+    assert graph.node_status(node) == PrefixStatus.WORD
+
+
+def test_dawg_dictionary_is_not_filtered(tmp_path: Path, good_puzzle: Puzzle) -> None:
+    """A DAWG is searched whole, so has no candidates."""
+    path = tmp_path / "words.dawg"
+    compile_dawg(["head", "bead"], path)
+    dictionary = Dictionary.load(path)
+
+    assert dictionary.word_count == 2
+    assert dictionary.candidates(good_puzzle) is None
+    assert dictionary.graph(None) is dictionary.dawg
+
+
+def test_words_needing_too_many_of_a_letter_are_pruned(good_puzzle: Puzzle) -> None:
+    """One E on the grid means no words with two."""
+    counts = good_puzzle.letter_counts
+    assert word_fits_letter_counts("BEAD", counts)
+    assert not word_fits_letter_counts("BEEF", counts)
+
+
+def test_words_with_unconnected_pairs_are_pruned(good_puzzle: Puzzle) -> None:
+    """A and I are in opposite corners, so no word can contain AI."""
+    bigrams = good_puzzle.bigrams
+    assert word_only_uses_bigrams("BEAD", bigrams)
+    assert not word_only_uses_bigrams("BAIL", bigrams)
+
+
+def test_bigram_pattern_matches_per_word_check() -> None:
+    """The regex keeps exactly the lines word_only_uses_bigrams would."""
+    puzzle = Puzzle("ABC_EFGHI")
+    words = ["A", "I", "BEAD", "BAIL", "HEAD", "FIGHE", "CAB", "ABE"]
+    pattern = bigram_pattern(puzzle.unique_letters, puzzle.bigrams)
+
+    expected = [w for w in words if word_only_uses_bigrams(w, puzzle.bigrams)]
+    assert pattern.findall("\n".join(words)) == expected
+
+
+def test_candidates_through_a_cell(good_puzzle: Puzzle) -> None:
+    """Only words with the cell's letter are candidates through it."""
+    dictionary = Dictionary(WordList.from_lines(["head", "bead", "fed"]))
+
+    assert dictionary.candidates(good_puzzle, through=1) == ["BEAD"]
@@ -0,0 +1,117 @@
+"""Test puzzle generation."""
+
+import pickle
+import random
+from pathlib import Path
+
+import pytest
+
+from pysquaredle.dawg import compile_dawg
+from pysquaredle.dictionary import Dictionary
+from pysquaredle.generator import Targets, _for_workers, generate, place_word
+from pysquaredle.puzzle import Puzzle
+from pysquaredle.solutions import Solutions
+from pysquaredle.solver import solve
+
+TEST_WORDS = "test_word_list.txt"
+
+
+@pytest.fixture(name="dictionary", scope="module")
+def fixture_dictionary() -> Dictionary:
+    """The test word list, loaded once."""
+    return Dictionary.load(TEST_WORDS)
+
+
+def test_distance() -> None:
+    """Distance adds up how far off each target is, ignoring short words."""
+    solutions = Solutions()
+    for word in ["CAT", "HEAD", "HEAT", "HEARD"]:
+        solutions.add(word, list(range(len(word))))
+
+    assert Targets(words=3).distance(solutions) == 0
+    assert Targets(words=5).distance(solutions) == 2
+    assert Targets(words=3, lengths={4: 1, 6: 1}).distance(solutions) == 2
+    assert Targets(words=4, min_length=3).distance(solutions) == 0
+
+
+def test_place_word() -> None:
+    """A seed word gets a path of neighbouring cells, each used once."""
+    puzzle = Puzzle("_" * 16)
+    path = place_word("ANTHROPOMORPHIZE", 4, random.Random(1))
+
+    assert path is not None
+    assert sorted(path) == list(range(16))
+    assert all(b in puzzle.neighbours_of(a) for a, b in zip(path, path[1:]))
+
+
+def test_generate_meets_targets(dictionary: Dictionary) -> None:
+    """The generated puzzle's words really are what the solver finds."""
+    generated = generate(
+        dictionary, 4, Targets(words=2, min_length=3), steps=200, restarts=3, seed=1
+    )
+
+    assert generated.distance == 0
+    assert generated.evaluated >= 1
+    assert generated.per_second > 0
+    found = solve(dictionary, Puzzle(generated.letters)).words()
+    assert generated.words == [word for word in found if len(word) >= 3]
+
+
+def test_generate_includes_seed_word(dictionary: Dictionary) -> None:
+    """The seed word is always in the puzzle."""
+    generated = generate(
+        dictionary, 5, Targets(seed_word="anthropomorphize"), steps=10, seed=2
+    )
+
+    assert "ANTHROPOMORPHIZE" in generated.words
+
+
+def test_generate_is_repeatable(dictionary: Dictionary) -> None:
+    """The same seed gives the same puzzle."""
+    targets = Targets(words=5)
+    first = generate(dictionary, 4, targets, steps=20, seed=3)
+    second = generate(dictionary, 4, targets, steps=20, seed=3)
+
+    assert first.letters == second.letters
+
+
+def test_generate_needs_targets(dictionary: Dictionary) -> None:
+    """Nothing to aim for, or a seed word that won't fit, is an error."""
+    with pytest.raises(ValueError):
+        generate(dictionary, 4, Targets())
+    with pytest.raises(ValueError):
+        generate(dictionary, 2, Targets(seed_word="HEARD"))
+
+
+def test_generate_needs_a_climb(dictionary: Dictionary) -> None:
+    """No restarts, or fewer than no steps, is an error up front."""
+    targets = Targets(words=2)
+    with pytest.raises(ValueError, match="Restarts"):
+        generate(dictionary, 4, targets, restarts=0)
+    with pytest.raises(ValueError, match="Steps"):
+        generate(dictionary, 4, targets, steps=-1)
+    assert generate(dictionary, 4, targets, steps=0).evaluated == 1
+
+
+def test_generate_in_parallel() -> None:
+    """Workers load the word list themselves and the result is the same."""
+    targets = Targets(words=2, min_length=3)
+    serial = generate(TEST_WORDS, 4, targets, steps=50, restarts=2, seed=4)
+    parallel = generate(TEST_WORDS, 4, targets, steps=50, restarts=2, seed=4, workers=2)
+
+    assert parallel.letters == serial.letters
+
+
+def test_generate_in_parallel_from_a_dawg(tmp_path: Path) -> None:
+    """A DAWG can't be copied to the workers, so they map its file."""
+    path = tmp_path / "test_words.dawg"
+    compile_dawg(Path(TEST_WORDS).read_text(encoding="utf-8").splitlines(), path)
+    targets = Targets(words=2, min_length=3)
+    serial = generate(TEST_WORDS, 4, targets, steps=50, restarts=2, seed=4)
+    parallel = generate(
+        Dictionary.load(path), 4, targets, steps=50, restarts=2, seed=4, workers=2
+    )
+
+    assert parallel.letters == serial.letters
+    # fork copies the map, but spawned or forkserver workers need a pickle
+    assert pickle.loads(pickle.dumps(_for_workers(Dictionary.load(path)))) == str(path)
@@ -0,0 +1,70 @@
+"""Test phase profiling."""
+
+import json
+import pstats
+import time
+from pathlib import Path
+
+from pysquaredle.profiling import Profile, phase
+from pysquaredle.puzzle import Puzzle
+from pysquaredle.solver import Solver, Strategy
+
+TEST_WORDS = "test_word_list.txt"
+
+
+def test_phase_without_profile() -> None:
+    """Marking a phase with nothing profiling is harmless."""
+    with phase("search"):
+        pass
+
+
+def test_solver_phases() -> None:
+    """Solving goes through the phases in order, each timed and traced."""
+    with Profile() as profile:
+        Solver(Puzzle("ABCDEFGHI"), TEST_WORDS, strategy=Strategy.GRID)
+
+    assert list(profile.phases) == ["read", "filter", "trie", "search"]
+    for each in profile.phases.values():
+        assert each.calls == 1
+        assert each.seconds >= 0
+        assert each.peak_bytes
+    assert profile.seconds == sum(each.seconds for each in profile.phases.values())
+
+
+def test_nested_phases_are_not_counted_twice() -> None:
+    """An outer phase's time leaves out the phases inside it."""
+    with Profile(trace_memory=False) as profile:
+        with phase("outer"):
+            with phase("inner"):
+                time.sleep(0.05)
+        with phase("inner"):
+            pass
+
+    assert profile.phases["inner"].calls == 2
+    assert profile.phases["inner"].seconds >= 0.05
+    assert profile.phases["outer"].seconds < 0.05
+    assert profile.peak_bytes is None
+
+
+def test_profile_files(tmp_path: Path) -> None:
+    """cProfile stats and JSON lines records are written."""
+    stats = tmp_path / "run.pstats"
+    records = tmp_path / "runs.jsonl"
+
+    for _ in range(2):
+        with Profile(stats_path=stats) as profile:
+            profile.record("startup", 0.5)
+            Solver(Puzzle("ABCDEFGHI"), TEST_WORDS)
+        profile.append_json(records, argv=["ABCDEFGHI"])
+
+    assert pstats.Stats(str(stats)).total_calls
+    lines = records.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    record = json.loads(lines[0])
+    assert record["argv"] == ["ABCDEFGHI"]
+    assert record["phases"][0] == {
+        "name": "startup",
+        "seconds": 0.5,
+        "peak_bytes": None,
+        "calls": 1,
+    }
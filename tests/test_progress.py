@@ -0,0 +1,109 @@
+"""Test the search progress reporters."""
+
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from pysquaredle.progress import (
+    THROTTLE_CHECK_NODES,
+    SearchMetrics,
+    TraceWriter,
+    fan_out,
+    read_trace,
+)
+from pysquaredle.puzzle import Puzzle
+from pysquaredle.solver import Solver
+from pysquaredle.trie import PrefixStatus
+
+TEST_WORDS = "test_word_list.txt"
+
+
+@pytest.fixture(name="puzzle")
+def fixture_puzzle() -> Puzzle:
+    """A puzzle with a few words in it."""
+    return Puzzle("UCHEMDRIAEHTRCGA")
+
+
+def test_metrics_count_the_search(puzzle: Puzzle) -> None:
+    """Every node is counted, and every word path found."""
+    steps = Mock()
+    metrics = SearchMetrics(puzzle)
+
+    solver = Solver(puzzle, TEST_WORDS, fan_out([steps, metrics]))
+
+    assert metrics.nodes == steps.call_count
+    assert sum(metrics.words_by_depth.values()) == solver.path_count()
+    assert metrics.words_by_depth[4] == len(solver.solutions.paths("HEAD"))
+    assert metrics.lookups >= metrics.nodes - puzzle.cell_count
+    assert 0 < metrics.dead_ends < metrics.nodes
+
+
+def test_metrics_lookups() -> None:
+    """A prefix node looks up each neighbour that's not on the path yet."""
+    metrics = SearchMetrics(Puzzle("ABCDEFGHI"))
+
+    metrics("A", [0], PrefixStatus.PREFIX)
+    metrics("AB", [0, 1], PrefixStatus.WORD_AND_PREFIX)
+    metrics("ABC", [0, 1, 2], PrefixStatus.WORD)
+
+    assert metrics.lookups == 3 + 4
+    assert metrics.dead_ends == 1
+    assert metrics.words_by_depth == {2: 1, 3: 1}
+
+
+def test_metrics_are_throttled() -> None:
+    """The summary goes out on the clock, and always when finished."""
+    output = Mock()
+    metrics = SearchMetrics(Puzzle("ABCDEFGHI"), output, interval=3600)
+    for _ in range(THROTTLE_CHECK_NODES * 2):
+        metrics("A", [0], PrefixStatus.WORD)
+    assert not output.called
+
+    metrics.finish()
+    output.assert_called_once()
+
+    eager = Mock()
+    metrics = SearchMetrics(Puzzle("ABCDEFGHI"), eager, interval=0)
+    for _ in range(THROTTLE_CHECK_NODES * 2):
+        metrics("A", [0], PrefixStatus.WORD)
+    assert eager.call_count == 2
+
+
+def test_trace_replays_the_search(puzzle: Puzzle, tmp_path: Path) -> None:
+    """Reading a trace gives back exactly what the reporter saw."""
+    steps: list[tuple[str, list[int], PrefixStatus]] = []
+
+    def record(word: str, path: list[int], status: PrefixStatus) -> None:
+        steps.append((word, path, status))
+
+    trace_file = tmp_path / "search.trace"
+    with TraceWriter(trace_file, puzzle) as trace:
+        Solver(puzzle, TEST_WORDS, fan_out([record, trace]))
+
+    traced, replayed = read_trace(trace_file)
+    assert traced.letters == puzzle.letters
+    assert list(replayed) == steps
+
+
+def test_read_trace_needs_a_trace(tmp_path: Path) -> None:
+    """Anything else is an error."""
+    not_trace = tmp_path / "words.txt"
+    not_trace.write_text("HEAD\nHEARD\n", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        read_trace(not_trace)
+
+
+def test_fan_out() -> None:
+    """No reporters is no reporter, one is itself, more are all called."""
+    first, second = Mock(), Mock()
+
+    assert fan_out([]) is None
+    assert fan_out([first]) is first
+
+    report = fan_out([first, second])
+    assert report is not None
+    report("A", [0], PrefixStatus.WORD)
+    first.assert_called_once_with("A", [0], PrefixStatus.WORD)
+    second.assert_called_once_with("A", [0], PrefixStatus.WORD)
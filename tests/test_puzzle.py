@@ -57,3 +57,54 @@ def test_list_neighbours(good_puzzle: Puzzle) -> None:
 0:1:4:6:7, 0:1:2:3:5:6:7:8, 1:2:4:7:8,
 3:4:7, 3:4:5:6:8, 4:5:7"""
     )
+
+
+def test_letter_counts() -> None:
+    """Repeated letters are counted."""
+    puzzle = Puzzle("ABAB")
+    assert puzzle.letter_counts["A"] == 2
+    assert puzzle.letter_counts["C"] == 0
+
+
+def test_bigrams(good_puzzle: Puzzle) -> None:
+    """Neighbouring letters make bigrams, both ways round."""
+    assert "AB" in good_puzzle.bigrams
+    assert "BA" in good_puzzle.bigrams
+    assert "AE" in good_puzzle.bigrams
+    assert "AC" not in good_puzzle.bigrams
+
+
+def test_with_letter(good_puzzle: Puzzle) -> None:
+    """Changing a cell makes a new puzzle and leaves the old one alone."""
+    changed = good_puzzle.with_letter(4, "x")
+
+    assert changed.letters == "ABCDXFGHI"
+    assert good_puzzle.letters == "ABCDEFGHI"
+
+
+def test_with_letter_checks_its_arguments(good_puzzle: Puzzle) -> None:
+    """One letter, in a cell that exists."""
+    with pytest.raises(ValueError):
+        good_puzzle.with_letter(4, "XY")
+    with pytest.raises(ValueError):
+        good_puzzle.with_letter(9, "X")
+
+
+def test_transformed(good_puzzle: Puzzle) -> None:
+    """Quarter turns clockwise, then flips left to right."""
+    assert good_puzzle.transformed(0).letters == "ABCDEFGHI"
+    assert good_puzzle.transformed(1).grid == "GDA\nHEB\nIFC\n"
+    assert good_puzzle.transformed(4).grid == "CBA\nFED\nIHG\n"
+    assert good_puzzle.cell_map(2) == list(reversed(range(9)))
+    with pytest.raises(ValueError):
+        good_puzzle.cell_map(8)
+
+
+def test_canonical(good_puzzle: Puzzle) -> None:
+    """Every rotation and reflection has the same canonical form."""
+    assert good_puzzle.canonical().letters == "ABCDEFGHI"
+    assert good_puzzle.canonical_symmetry == 0
+    for symmetry in range(8):
+        turned = good_puzzle.transformed(symmetry)
+        assert turned.canonical().letters == "ABCDEFGHI"
+        assert turned.transformed(turned.canonical_symmetry).letters == "ABCDEFGHI"
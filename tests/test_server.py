@@ -0,0 +1,177 @@
+"""Test the solve daemon."""
+
+import http.client
+import json
+import socket
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pysquaredle.server import SolveService, make_server
+
+TEST_WORDS = "test_word_list.txt"
+
+
+@pytest.fixture(name="service", scope="module")
+def fixture_service() -> SolveService:
+    """The test word list, loaded once."""
+    return SolveService.load([TEST_WORDS])
+
+
+@pytest.fixture(name="port")
+def fixture_port(service: SolveService) -> Iterator[int]:
+    """A running server on a free localhost port."""
+    server = make_server(service, "0")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1]  # type: ignore[attr-defined]
+    server.shutdown()
+    server.server_close()
+
+
+def request(
+    connection: http.client.HTTPConnection, method: str, path: str, body: Any = None
+) -> tuple[int, Any]:
+    """Send a request, return the status and decoded JSON."""
+    connection.request(method, path, None if body is None else json.dumps(body))
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def test_solve(service: SolveService) -> None:
+    """A solve request gets the words, and paths if asked for."""
+    result = service.solve({"letters": "abcdefghi", "paths": True})
+
+    assert result["word_list"] == "test_word_list"
+    assert result["letters"] == "abcdefghi"
+    assert result["words"] == ["HEAD"]
+    assert result["paths"] == {"HEAD": [[7, 4, 0, 3]]}
+    assert result["word_count"] == result["path_count"] == 1
+
+
+def test_solve_with_options(service: SolveService) -> None:
+    """Options, strategy and counting are passed on."""
+    result = service.solve(
+        {
+            "letters": "UCHEMDRIAEHTRCGA",
+            "strategy": "grid",
+            "count_only": True,
+            "options": {"min_length": 5},
+        }
+    )
+
+    assert "words" not in result
+    assert result["word_count"] == 1
+
+
+@pytest.mark.parametrize(
+    "bad",
+    [
+        ["ABCDEFGHI"],
+        {"letters": 9},
+        {"letters": "ABC1"},
+        {"letters": "ABCDEFGHI", "word_list": "nope"},
+        {"letters": "ABCDEFGHI", "options": {"fastest": True}},
+        {"letters": "ABCDEFGHI", "strategy": "guess"},
+        {"letters": "ABCDEFGHI", "word_list": [1]},
+        {"letters": "ABCDEFGHI", "options": ["max_words"]},
+        {"letters": "ABCDEFGHI", "options": {"max_words": "x"}},
+        {"letters": "ABCDEFGHI", "options": {"max_words": True}},
+        {"letters": "ABCDEFGHI", "options": {"min_length": 4.5}},
+        {"letters": "ABCDEFGHI", "options": {"time_budget": "1"}},
+        {"letters": "ABCDEFGHI", "options": {"first_path_only": 1}},
+    ],
+)
+def test_bad_requests(service: SolveService, bad: Any) -> None:
+    """Requests that don't make sense are errors."""
+    with pytest.raises(ValueError):
+        service.solve(bad)
+
+
+def test_http(port: int) -> None:
+    """Word lists and solving over HTTP, with errors as 400s."""
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+
+    assert request(connection, "GET", "/word-lists") == (200, {"test_word_list": 2554})
+    status, result = request(connection, "POST", "/solve", {"letters": "ABCDEFGHI"})
+    assert status == 200
+    assert result["words"] == ["HEAD"]
+    status, result = request(connection, "POST", "/solve", {"letters": "AB"})
+    assert status == 400
+    assert "error" in result
+    assert request(connection, "GET", "/solve")[0] == 404
+
+
+def test_good_option_types(service: SolveService) -> None:
+    """Numbers can be whole or not where it makes sense, and null means none."""
+    result = service.solve(
+        {
+            "letters": "ABCDEFGHI",
+            "options": {"time_budget": 5, "max_words": None, "first_path_only": True},
+        }
+    )
+
+    assert result["words"] == ["HEAD"]
+
+
+def test_bad_content_length(port: int) -> None:
+    """A length that isn't a number gets a 400, not a dropped connection."""
+    connection = http.client.HTTPConnection("127.0.0.1", port)
+    for length in ["lots", "-1"]:
+        connection.putrequest("POST", "/solve")
+        connection.putheader("Content-Length", length)
+        connection.endheaders()
+        response = connection.getresponse()
+        assert response.status == 400
+        assert "error" in json.loads(response.read())
+        connection.close()
+
+
+def test_concurrent_clients(port: int) -> None:
+    """Clients solving at once all get the right answers."""
+    puzzles = ["ABCDEFGHI", "HTEZRONIOPAHMORP", "UCHEMDRIAEHTRCGA"] * 4
+
+    def solve(letters: str) -> list[str]:
+        connection = http.client.HTTPConnection("127.0.0.1", port)
+        return request(connection, "POST", "/solve", {"letters": letters})[1]["words"]
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        answers = list(pool.map(solve, puzzles))
+
+    assert answers[:3] == [["HEAD"], ["ANTHROPOMORPHIZE"], ["HIRER", "HEAD"]]
+    assert answers == answers[:3] * 4
+
+
+class UnixConnection(http.client.HTTPConnection):
+    """HTTP over a Unix socket."""
+
+    def __init__(self, path: str) -> None:
+        """Connect to the socket at path."""
+        super().__init__("localhost")
+        self.socket_path = path
+
+    def connect(self) -> None:
+        """Use the socket rather than TCP."""
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.socket_path)
+
+
+def test_unix_socket(service: SolveService, tmp_path: Path) -> None:
+    """The same service on a Unix socket."""
+    path = str(tmp_path / "squaredle.sock")
+    server = make_server(service, path)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        status, result = request(
+            UnixConnection(path), "POST", "/solve", {"letters": "ABCDEFGHI"}
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert status == 200
+    assert result["words"] == ["HEAD"]
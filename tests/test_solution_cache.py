@@ -0,0 +1,161 @@
+"""Test the solution cache."""
+
+from pathlib import Path
+
+import pytest
+
+from pysquaredle.dictionary import Dictionary
+from pysquaredle.puzzle import Puzzle
+from pysquaredle.solution_cache import SolutionCache, solution_key
+from pysquaredle.solutions import Solutions
+from pysquaredle.solver import SearchOptions, Solver, solve
+from pysquaredle.word_list import WordList
+
+TEST_WORDS = "test_word_list.txt"
+
+
+@pytest.fixture(name="dictionary", scope="module")
+def fixture_dictionary() -> Dictionary:
+    """The test word list, loaded once."""
+    return Dictionary.load(TEST_WORDS)
+
+
+@pytest.fixture(name="puzzle")
+def fixture_puzzle() -> Puzzle:
+    """A puzzle with a few words in it."""
+    return Puzzle("UCHEMDRIAEHTRCGA")
+
+
+def solved(*words: str) -> Solutions:
+    """Solutions with one made up path per word."""
+    solutions = Solutions()
+    for word in words:
+        solutions.add(word, [0, 1, 2, 3])
+    return solutions
+
+
+def contents(solutions: Solutions) -> dict[str, list[list[int]]]:
+    """Each word's paths, to compare solutions by."""
+    return {word: solutions.paths(word) for word in solutions.words()}
+
+
+def test_hits_misses_and_eviction() -> None:
+    """The least recently used solutions go first."""
+    cache = SolutionCache(entries=2)
+    cache.put("a", solved("AAAA"))
+    cache.put("b", solved("BBBB"))
+    assert cache.get("a") is not None
+    cache.put("c", solved("CCCC"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats() == {"hits": 3, "misses": 1, "size": 2}
+
+
+def test_on_disk(tmp_path: Path) -> None:
+    """Solutions on disk outlast the cache that put them there."""
+    SolutionCache(directory=tmp_path).put("key", solved("HEAD", "HEAT"))
+    (tmp_path / "junk.pickle").write_bytes(b"not a pickle")
+
+    cache = SolutionCache(directory=tmp_path)
+    found = cache.get("key")
+    assert found is not None
+    assert found.words() == ["HEAD", "HEAT"]
+    assert found.paths("HEAD") == [[0, 1, 2, 3]]
+    assert cache.get("junk") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_key(dictionary: Dictionary, puzzle: Puzzle) -> None:
+    """Anything that changes the answer changes the key, case doesn't."""
+    key = solution_key(dictionary, puzzle)
+
+    assert solution_key(dictionary, Puzzle(puzzle.letters.lower())) == key
+    assert solution_key(dictionary, puzzle, min_length=5) != key
+    assert solution_key(dictionary, puzzle, count_only=True) != key
+    other = Dictionary(WordList(["HEAD"]))
+    assert solution_key(other, puzzle) != key
+
+
+def test_fingerprint(dictionary: Dictionary) -> None:
+    """Word lists are told apart by their words, or their file."""
+    assert dictionary.fingerprint
+    assert (
+        Dictionary(WordList(["HEAD", "HEAT"])).fingerprint
+        == Dictionary(WordList(["HEAD", "HEAT"])).fingerprint
+        != Dictionary(WordList(["HEAD"])).fingerprint
+    )
+
+
+def test_solver_uses_cache(dictionary: Dictionary, puzzle: Puzzle) -> None:
+    """The second Solver gets the first one's solutions without searching."""
+    cache = SolutionCache()
+    first = Solver(puzzle, dictionary, cache=cache)
+    second = Solver(puzzle, dictionary, cache=cache)
+
+    assert contents(second.solutions) == contents(first.solutions)
+    assert "_search" not in vars(second)
+    assert list(second.iter_solutions()) == list(first.iter_solutions())
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    counted = Solver(puzzle, dictionary, cache=cache, count_only=True)
+    assert counted.path_count() == first.path_count()
+    assert cache.stats()["size"] == 2
+
+
+def test_solve_uses_cache(dictionary: Dictionary, puzzle: Puzzle) -> None:
+    """solve looks in the cache too."""
+    cache = SolutionCache()
+
+    canonical = puzzle.canonical()
+
+    assert solve(dictionary, canonical, cache=cache) is solve(
+        dictionary, canonical, cache=cache
+    )
+    assert cache.hits == 1
+
+
+def test_out_of_time_is_not_cached(dictionary: Dictionary, puzzle: Puzzle) -> None:
+    """Solutions cut short by the clock could be different next time."""
+    cache = SolutionCache()
+    solutions = solve(
+        dictionary, puzzle, options=SearchOptions(time_budget=0), cache=cache
+    )
+
+    assert solutions.truncated
+    assert cache.stats()["size"] == 0
+
+
+def test_symmetries_share_solutions(dictionary: Dictionary, puzzle: Puzzle) -> None:
+    """Turning or flipping the grid is solved once, with the paths moved."""
+    cache = SolutionCache()
+    solve(dictionary, puzzle, cache=cache)
+
+    for symmetry in range(8):
+        variant = puzzle.transformed(symmetry)
+        cached = solve(dictionary, variant, cache=cache)
+        fresh = solve(dictionary, variant)
+        assert cached.words() == fresh.words()
+        assert contents(cached) == contents(fresh)
+    assert (cache.hits, cache.misses) == (8, 1)
+
+    counted = solve(dictionary, puzzle, count_only=True, cache=cache)
+    turned = solve(dictionary, puzzle.transformed(1), count_only=True, cache=cache)
+    assert turned.path_count() == counted.path_count() == 3
+    assert cache.misses == 3
+
+
+def test_stopping_early_is_not_shared(dictionary: Dictionary, puzzle: Puzzle) -> None:
+    """Where a search stops depends on which way round the grid is."""
+    options = SearchOptions(first_path_only=True)
+    flipped = puzzle.transformed(4)
+
+    assert solution_key(dictionary, flipped) == solution_key(dictionary, puzzle)
+    assert solution_key(dictionary, flipped, first_path_only=True) != solution_key(
+        dictionary, puzzle, first_path_only=True
+    )
+    cache = SolutionCache()
+    solve(dictionary, puzzle, options=options, cache=cache)
+    solve(dictionary, flipped, options=options, cache=cache)
+    assert cache.hits == 0
@@ -89,4 +89,91 @@ def test_formatted_solutions_honours_grouping(
     )
 
 
+def test_permuted(good_solutions: Solutions) -> None:
+    """Paths move cell by cell and come out in grid order, counts stay."""
+    cells = list(reversed(range(16)))
+    permuted = good_solutions.permuted(cells)
+
+    assert permuted.words() == ["HEAD", "HIRER"]
+    assert permuted.paths("HIRER") == [[5, 8, 9, 6, 3], [13, 8, 9, 6, 3]]
+    assert permuted.path_count() == good_solutions.path_count()
+    assert good_solutions.permuted(range(16)).paths("HEAD") == good_solutions.paths(
+        "HEAD"
+    )
+
+
+def test_paths_on_big_grids() -> None:
+    """Cells past 255 still fit, and paths come back as they went in."""
+    solutions = Solutions()
+    solutions.add("HEAD", [0, 1, 2, 3])
+    solutions.add("HEAD", [250, 251, 300, 301])
+    solutions.add("HEAD", [4, 5, 6, 7])
+
+    assert solutions.paths("HEAD") == [
+        [0, 1, 2, 3],
+        [250, 251, 300, 301],
+        [4, 5, 6, 7],
+    ]
+    assert solutions.path_count_for("HEAD") == 3
+    assert solutions.stored_path_count_for("HEAD") == 3
+    solutions.add_count("HEAT", 2)
+    assert solutions.stored_path_count_for("HEAT") == 0
+    assert solutions.paths("HEAT") == []
+    with pytest.raises(ValueError):
+        solutions.add("HEAT", [0, 1])
+
+
+def test_indexes(good_solutions: Solutions) -> None:
+    """Words by length, start cell and cells used."""
+    assert good_solutions.grouped_by_length() == {4: ["HEAD"], 5: ["HIRER"]}
+    assert good_solutions.starting_at(10) == ["HIRER", "HEAD"]
+    assert good_solutions.starting_at(2) == ["HIRER"]
+    assert good_solutions.starting_at(0) == []
+    assert good_solutions.through(9) == ["HIRER", "HEAD"]
+    assert good_solutions.through(6) == ["HIRER"]
+
+
+def test_indexes_follow_additions() -> None:
+    """Adding words or paths rebuilds the indexes next time they're used."""
+    solutions = Solutions()
+    solutions.add("HEAT", [0, 1, 2, 3])
+    solutions.add("ACE", [4, 5, 6])
+    assert solutions.raw_solution_words(sort=True, length=True) == ["ACE", "HEAT"]
+    assert solutions.starting_at(7) == []
+
+    solutions.add("BEE", [7, 8, 9])
+    solutions.add("HEAT", [7, 1, 2, 3])
+    assert solutions.raw_solution_words(sort=True, length=True) == [
+        "ACE",
+        "BEE",
+        "HEAT",
+    ]
+    assert solutions.raw_solution_words(sort=False, length=True) == [
+        "ACE",
+        "BEE",
+        "HEAT",
+    ]
+    assert solutions.raw_solution_words(sort=False, length=False) == [
+        "HEAT",
+        "ACE",
+        "BEE",
+    ]
+    assert solutions.starting_at(7) == ["HEAT", "BEE"]
+
+    solutions.add_count("AB", 2)
+    assert solutions.grouped_by_length(sort=True)[2] == ["AB"]
+
+
+def test_listing_is_a_copy(good_solutions: Solutions) -> None:
+    """Changing a list handed out doesn't change the index behind it."""
+    good_solutions.raw_solution_words(sort=True, length=False).clear()
+    good_solutions.grouped_by_length()[4].clear()
+
+    assert good_solutions.raw_solution_words(sort=True, length=False) == [
+        "HEAD",
+        "HIRER",
+    ]
+    assert good_solutions.grouped_by_length()[4] == ["HEAD"]
+
+
 # TODO test more combinations of options?
@@ -1,11 +1,23 @@
 """Test the Solver class."""
 
+from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 
+from pysquaredle.dawg import compile_dawg
+from pysquaredle.dictionary import Dictionary, build_trie
 from pysquaredle.puzzle import Puzzle
-from pysquaredle.solver import Solver
+from pysquaredle.solver import (
+    Deadline,
+    PuzzleSearch,
+    SearchOptions,
+    Solver,
+    Strategy,
+    count_paths,
+    resolve_cell,
+    solve,
+)
 
 TEST_WORDS = "test_word_list.txt"
 
@@ -32,8 +44,9 @@ def test_word_list_count(good_puzzle: Puzzle) -> None:
     solver = Solver(good_puzzle, word_list_path=TEST_WORDS)
     solver2 = Solver(Puzzle("ABCDEFGHIJKLMNOP"), word_list_path=TEST_WORDS)
 
-    assert solver.word_list_count == 3
-    assert solver2.word_list_count == 109
+    # letters must be present, often enough, and next to each other
+    assert solver.word_list_count == 1
+    assert solver2.word_list_count == 0
 
 
 def test_solution_includes_all_letter_word(anthropomorphize_puzzle: Puzzle) -> None:
@@ -79,3 +92,268 @@ def test_progress_reporter_is_called(good_puzzle: Puzzle) -> None:
 
     Solver(good_puzzle, word_list_path=TEST_WORDS, update_func=update_func)
     assert update_func.called
+
+
+def test_compact_trie_gives_same_solutions(
+    anthropomorphize_puzzle: Puzzle,
+) -> None:
+    """The array-backed trie is a drop-in replacement."""
+    solver = Solver(anthropomorphize_puzzle, word_list_path=TEST_WORDS)
+    compact = Solver(anthropomorphize_puzzle, word_list_path=TEST_WORDS, compact=True)
+
+    assert compact.raw_solution_words() == solver.raw_solution_words()
+    assert compact.word_list_count == solver.word_list_count
+
+
+def test_large_grid() -> None:
+    """An 8x8 grid solves, and every path spells its word through neighbours."""
+    puzzle = Puzzle("HTEZRONIOPAHMORPUCHEMDRIAEHTRCGA" * 2)
+    solver = Solver(puzzle, word_list_path=TEST_WORDS)
+
+    assert solver.word_count() > 0
+    for word in solver.solutions.words():
+        for path in solver.solutions.paths(word):
+            assert "".join(puzzle.letters[i] for i in path) == word
+            assert len(set(path)) == len(path)
+            for cell, following in zip(path, path[1:]):
+                assert following in puzzle.neighbours_of(cell)
+
+
+def test_parallel_solve_matches_serial(anthropomorphize_puzzle: Puzzle) -> None:
+    """Farming start cells out to processes gives the same solutions, in order."""
+    serial = Solver(anthropomorphize_puzzle, word_list_path=TEST_WORDS)
+    parallel = Solver(anthropomorphize_puzzle, word_list_path=TEST_WORDS, workers=2)
+
+    assert parallel.raw_solution_words() == serial.raw_solution_words()
+    for word in serial.solutions.words():
+        assert parallel.solutions.paths(word) == serial.solutions.paths(word)
+
+
+def test_lazy_solver_streams_solutions(good_puzzle: Puzzle) -> None:
+    """A lazy Solver finds nothing until iterated, then fills its solutions."""
+    solver = Solver(good_puzzle, word_list_path=TEST_WORDS, lazy=True)
+    assert solver.word_count() == 0
+
+    streamed = list(solver.iter_solutions())
+
+    assert streamed
+    assert [word for word, _ in streamed] == solver.raw_solution_words()
+    solutions = solver.solutions
+    assert [path for _, path in streamed] == [
+        path for word in solutions.words() for path in solutions.paths(word)
+    ]
+
+
+def test_iter_solutions_replays_once_solved(good_puzzle: Puzzle) -> None:
+    """Iterating a solved Solver doesn't search again or duplicate paths."""
+    solver = Solver(good_puzzle, word_list_path=TEST_WORDS)
+    paths = solver.path_count()
+
+    assert len(list(solver.iter_solutions())) == paths
+    assert solver.path_count() == paths
+
+
+def test_count_only_matches_full_enumeration() -> None:
+    """Counting paths gives the same words and totals without storing paths."""
+    puzzle = Puzzle("UCHEMDRIAEHTRCGA")
+    full = Solver(puzzle, word_list_path=TEST_WORDS)
+    counted = Solver(puzzle, word_list_path=TEST_WORDS, count_only=True)
+
+    assert counted.raw_solution_words() == full.raw_solution_words()
+    assert counted.path_count() == full.path_count()
+    for word in full.solutions.words():
+        expected = len(full.solutions.paths(word))
+        assert counted.solutions.path_count_for(word) == expected
+        assert counted.solutions.paths(word) == []
+
+
+def test_count_only_cannot_stream(good_puzzle: Puzzle) -> None:
+    """There are no paths to hand out when only counting."""
+    solver = Solver(good_puzzle, word_list_path=TEST_WORDS, count_only=True)
+    with pytest.raises(ValueError):
+        next(solver.iter_solutions())
+
+
+@pytest.mark.parametrize(
+    "letters", ["HTEZRONIOPAHMORP", "UCHEMDRIAEHTRCGA", "ABCDEFGHI"]
+)
+def test_word_first_matches_grid_first(letters: str) -> None:
+    """Tracing words gives the same solutions, paths and order as the grid."""
+    puzzle = Puzzle(letters)
+    grid = Solver(puzzle, word_list_path=TEST_WORDS, strategy=Strategy.GRID)
+    word = Solver(puzzle, word_list_path=TEST_WORDS, strategy=Strategy.WORD)
+
+    assert list(word.iter_solutions()) == list(grid.iter_solutions())
+
+
+def test_auto_strategy_choice(good_puzzle: Puzzle) -> None:
+    """Few candidates go word-first, unless streaming, stopping early or reporting."""
+    assert Solver(good_puzzle, TEST_WORDS).strategy == Strategy.WORD
+    assert Solver(good_puzzle, TEST_WORDS, lazy=True).strategy == Strategy.GRID
+    assert (
+        Solver(good_puzzle, TEST_WORDS, options=SearchOptions(max_words=1)).strategy
+        == Strategy.GRID
+    )
+    assert Solver(good_puzzle, TEST_WORDS, Mock(), lazy=True).strategy == Strategy.GRID
+    assert (
+        Solver(good_puzzle, TEST_WORDS, lazy=True, count_only=True).strategy
+        == Strategy.GRID
+    )
+
+
+def test_solver_accepts_a_loaded_dictionary(anthropomorphize_puzzle: Puzzle) -> None:
+    """One Dictionary can be shared between solvers, with the same results."""
+    dictionary = Dictionary.load(TEST_WORDS)
+    shared = Solver(anthropomorphize_puzzle, dictionary)
+    own = Solver(anthropomorphize_puzzle, word_list_path=TEST_WORDS)
+
+    assert shared.raw_solution_words() == own.raw_solution_words()
+    assert shared.word_list_count == own.word_list_count
+
+
+def test_solve_function(good_puzzle: Puzzle) -> None:
+    """solve() needs nothing but a dictionary and a puzzle."""
+    dictionary = Dictionary.load(TEST_WORDS)
+
+    assert solve(dictionary, good_puzzle).words() == ["HEAD"]
+    counted = solve(dictionary, good_puzzle, count_only=True)
+    assert counted.path_count_for("HEAD") == 1
+
+
+def test_puzzle_search_only_builds_trie_for_grid(good_puzzle: Puzzle) -> None:
+    """Word-first never needs the trie."""
+    dictionary = Dictionary.load(TEST_WORDS)
+    search = PuzzleSearch(dictionary, good_puzzle, strategy=Strategy.WORD)
+
+    assert list(search) == [("HEAD", [7, 4, 0, 3])]
+    assert "graph" not in vars(search)
+
+
+def test_first_path_only() -> None:
+    """Each word keeps just its first path."""
+    puzzle = Puzzle("UCHEMDRIAEHTRCGA")
+    full = Solver(puzzle, word_list_path=TEST_WORDS)
+    first = Solver(
+        puzzle, word_list_path=TEST_WORDS, options=SearchOptions(first_path_only=True)
+    )
+
+    assert first.raw_solution_words() == full.raw_solution_words()
+    for word in full.solutions.words():
+        assert first.solutions.paths(word) == full.solutions.paths(word)[:1]
+    assert not first.solutions.truncated
+
+
+def test_min_length() -> None:
+    """Words shorter than the minimum are never found."""
+    words = Solver(
+        Puzzle("UCHEMDRIAEHTRCGA"), TEST_WORDS, options=SearchOptions(min_length=5)
+    ).raw_solution_words()
+
+    assert words == ["HIRER"]
+
+
+@pytest.mark.parametrize("strategy", [Strategy.GRID, Strategy.WORD])
+def test_max_words_truncates(strategy: Strategy) -> None:
+    """Stopping after N words keeps the first N, and says it stopped."""
+    puzzle = Puzzle("UCHEMDRIAEHTRCGA")
+    full = Solver(puzzle, TEST_WORDS, strategy=strategy).raw_solution_words()
+    limited = Solver(
+        puzzle, TEST_WORDS, strategy=strategy, options=SearchOptions(max_words=1)
+    )
+
+    assert limited.raw_solution_words() == full[:1]
+    assert limited.solutions.truncated
+
+    enough = Solver(puzzle, TEST_WORDS, options=SearchOptions(max_words=len(full)))
+    assert not enough.solutions.truncated
+
+
+def test_count_only_honours_options() -> None:
+    """Counting can be limited too."""
+    counted = Solver(
+        Puzzle("UCHEMDRIAEHTRCGA"),
+        TEST_WORDS,
+        count_only=True,
+        options=SearchOptions(first_path_only=True, max_words=1),
+    )
+
+    assert counted.word_count() == 1
+    assert counted.path_count() == 1
+    assert counted.solutions.truncated
+
+
+def test_time_budget_returns_partial_solutions(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Once the budget is spent, the search stops and says so."""
+    # the clock jumps an hour every time it's read
+    ticks = iter(range(0, 10**9, 3600))
+    monkeypatch.setattr("pysquaredle.solver.time.monotonic", lambda: next(ticks))
+    puzzle = Puzzle("HTEZRONIOPAHMORPUCHEMDRIAEHTRCGA" * 2)
+
+    solver = Solver(puzzle, TEST_WORDS, options=SearchOptions(time_budget=60))
+
+    assert solver.solutions.truncated
+    assert solver.word_count() < Solver(puzzle, TEST_WORDS).word_count()
+
+
+def test_counting_stops_inside_a_start_cell() -> None:
+    """A start cell with a lot of states doesn't run on past the deadline."""
+
+    class SecondLook(Deadline):
+        """Expires the second time it's asked."""
+
+        looks = 0
+
+        def expired(self) -> bool:
+            self.looks += 1
+            self.reached = self.looks > 1
+            return self.reached
+
+    puzzle = Puzzle("E" * 16)
+    graph = build_trie(["E" * 9], compact=False)
+    neighbours = [puzzle.neighbours_of(cell) for cell in range(16)]
+    deadline = SecondLook(60)
+
+    assert count_paths(graph, puzzle.letters, neighbours, deadline) == {}
+    assert deadline.reached
+    assert count_paths(graph, puzzle.letters, neighbours)["E" * 9] > 0
+
+
+@pytest.mark.parametrize(
+    ("cell", "letter"), [(0, "S"), (5, "E"), (10, "_"), (15, "A"), (7, "T")]
+)
+def test_resolve_cell_matches_fresh_solve(cell: int, letter: str) -> None:
+    """Changing one cell and re-solving gives what solving from scratch does."""
+    dictionary = Dictionary.load(TEST_WORDS)
+    puzzle = Puzzle("UCHEMDRIAEHTRCGA")
+    solutions = solve(dictionary, puzzle)
+
+    changed, resolved = resolve_cell(dictionary, puzzle, solutions, cell, letter)
+    fresh = solve(dictionary, changed)
+
+    assert changed.letters[cell] == letter
+    assert resolved.words() == fresh.words()
+    for word in fresh.words():
+        assert resolved.paths(word) == fresh.paths(word)
+
+
+def test_resolve_cell_needs_every_path(good_puzzle: Puzzle) -> None:
+    """Counts or limited solutions can't be patched up."""
+    dictionary = Dictionary.load(TEST_WORDS)
+    counted = solve(dictionary, good_puzzle, count_only=True)
+
+    with pytest.raises(ValueError):
+        resolve_cell(dictionary, good_puzzle, counted, 0, "B")
+
+
+def test_resolve_cell_with_a_dawg(tmp_path: Path) -> None:
+    """A DAWG can't be traced from the middle, but still gives the answer."""
+    path = tmp_path / "words.dawg"
+    compile_dawg(Path(TEST_WORDS).read_text(encoding="utf-8").splitlines(), path)
+    dictionary = Dictionary.load(path)
+    puzzle = Puzzle("UCHEMDRIAEHTRCGA")
+
+    changed, resolved = resolve_cell(
+        dictionary, puzzle, solve(dictionary, puzzle), 3, "D"
+    )
+
+    assert resolved.words() == solve(dictionary, changed).words()
@@ -0,0 +1,87 @@
+"""Test the Trie class."""
+
+import pytest
+
+from pysquaredle.trie import CompactTrie, PrefixStatus, Trie
+
+
+@pytest.fixture(name="small_trie")
+def fixture_small_trie() -> Trie:
+    """A trie with a handful of overlapping words."""
+    trie = Trie()
+    for word in ["HEAD", "HEADER", "HEAT", "HIRER"]:
+        trie.insert(word)
+    return trie
+
+
+def test_status_of_missing_prefix(small_trie: Trie) -> None:
+    """Letters that don't start any word."""
+    assert small_trie.status("HX") == PrefixStatus.NOT_PREFIX
+    assert small_trie.status("Z") == PrefixStatus.NOT_PREFIX
+
+
+def test_status_of_prefix_only(small_trie: Trie) -> None:
+    """Letters that start words but aren't words themselves."""
+    assert small_trie.status("HEA") == PrefixStatus.PREFIX
+
+
+def test_status_of_word_only(small_trie: Trie) -> None:
+    """A word with no longer words beyond it."""
+    assert small_trie.status("HEAT") == PrefixStatus.WORD
+    assert small_trie.status("HEADER") == PrefixStatus.WORD
+
+
+def test_status_of_word_and_prefix(small_trie: Trie) -> None:
+    """A word that is also the start of a longer word."""
+    status = small_trie.status("HEAD")
+    assert status == PrefixStatus.WORD_AND_PREFIX
+    assert status & PrefixStatus.WORD
+    assert status & PrefixStatus.PREFIX
+
+
+def test_search_still_returns_completions(small_trie: Trie) -> None:
+    """Search is kept for callers who want the words themselves."""
+    assert small_trie.search("HEA") == ["HEAD", "HEADER", "HEAT"]
+    assert small_trie.search("HX") == []
+
+
+def test_child_cursor_walks_one_letter_at_a_time(small_trie: Trie) -> None:
+    """A node can be extended without going back to the root."""
+    node = small_trie.root
+    for char in "HEAD":
+        child = small_trie.child(node, char)
+        assert child is not None
+        node = child
+
+    assert small_trie.node_status(node) == PrefixStatus.WORD_AND_PREFIX
+    assert small_trie.child(node, "Z") is None
+
+
+@pytest.fixture(name="compact_trie")
+def fixture_compact_trie() -> CompactTrie:
+    """The same words in a CompactTrie."""
+    trie = CompactTrie()
+    for word in ["HEAD", "HEADER", "HEAT", "HIRER"]:
+        trie.insert(word)
+    return trie
+
+
+def test_compact_trie_status(compact_trie: CompactTrie) -> None:
+    """CompactTrie answers status queries like Trie."""
+    assert compact_trie.status("HX") == PrefixStatus.NOT_PREFIX
+    assert compact_trie.status("HEA") == PrefixStatus.PREFIX
+    assert compact_trie.status("HEAT") == PrefixStatus.WORD
+    assert compact_trie.status("HEAD") == PrefixStatus.WORD_AND_PREFIX
+
+
+def test_compact_trie_search(compact_trie: CompactTrie) -> None:
+    """CompactTrie returns completions like Trie."""
+    assert compact_trie.search("HEA") == ["HEAD", "HEADER", "HEAT"]
+    assert compact_trie.search("HX") == []
+
+
+def test_compact_trie_shares_prefixes(compact_trie: CompactTrie) -> None:
+    """One node per distinct prefix, plus the root."""
+    words = ["HEAD", "HEADER", "HEAT", "HIRER"]
+    prefixes = {word[:i] for word in words for i in range(len(word) + 1)}
+    assert len(compact_trie) == len(prefixes)
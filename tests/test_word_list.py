@@ -0,0 +1,75 @@
+"""Test word list normalisation and caching."""
+
+from pathlib import Path
+
+from pysquaredle.word_list import WordList, letter_mask, read_pickle, write_pickle
+
+
+def test_letter_mask() -> None:
+    """One bit per letter, repeats don't matter."""
+    assert letter_mask("A") == 1
+    assert letter_mask("ABBA") == 0b11
+    assert letter_mask("Z") == 1 << 25
+
+
+def test_lines_are_normalised() -> None:
+    """Upper-cased, stripped, de-duplicated and sorted by length."""
+    word_list = WordList.from_lines(["head ", "HEAD", "", "hirer", "ace"])
+
+    assert word_list.words == ["ACE", "HEAD", "HIRER"]
+    assert word_list.masks == [letter_mask(w) for w in word_list.words]
+
+
+def test_cache_is_reused(cache: Path, tmp_path: Path) -> None:
+    """Second load comes from the cache."""
+    source = tmp_path / "words.txt"
+    source.write_text("head\nhirer\n", encoding="utf-8")
+
+    first = WordList.load(source)
+    assert len(list(cache.glob("*.pickle"))) == 1
+
+    second = WordList.load(source)
+    assert second.words == first.words == ["HEAD", "HIRER"]
+    assert second.digest == first.digest
+
+
+def test_cache_is_invalidated_by_changes(cache: Path, tmp_path: Path) -> None:
+    """Editing the source gives a fresh entry."""
+    source = tmp_path / "words.txt"
+    source.write_text("head\n", encoding="utf-8")
+    first = WordList.load(source)
+
+    source.write_text("head\nheader\n", encoding="utf-8")
+    second = WordList.load(source)
+
+    assert second.digest != first.digest
+    assert second.words == ["HEAD", "HEADER"]
+    assert len(list(cache.glob("*.pickle"))) == 2
+
+
+def test_pickles_are_versioned(tmp_path: Path) -> None:
+    """Only the version that was written reads back, and junk reads as None."""
+    path = tmp_path / "nested" / "entry.pickle"
+    write_pickle(path, 2, ["HEAD"])
+
+    assert read_pickle(path, 2) == ["HEAD"]
+    assert read_pickle(path, 1) is None
+    assert list(path.parent.iterdir()) == [path]
+    path.write_bytes(b"junk")
+    assert read_pickle(path, 2) is None
+    assert read_pickle(tmp_path / "missing.pickle", 2) is None
+
+
+def test_matching_filters_by_letters_and_length() -> None:
+    """Only words short enough and made of the given letters."""
+    word_list = WordList.from_lines(["ACE", "CAFE", "FACADE", "HEAD", "DEAF"])
+
+    assert word_list.matching("ACDEF", 4) == ["ACE", "CAFE", "DEAF"]
+    assert word_list.matching("ACDEF", 6) == ["ACE", "CAFE", "DEAF", "FACADE"]
+
+
+def test_matching_ignores_gaps() -> None:
+    """Gap cells ('_') don't let odd characters through."""
+    word_list = WordList.from_lines(["A_B", "AB"])
+
+    assert word_list.matching("AB_", 9) == ["AB"]